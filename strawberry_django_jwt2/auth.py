@@ -1,13 +1,18 @@
 import asyncio
 import inspect
 import re
+from typing import Any, NamedTuple
 
 from asgiref.sync import sync_to_async
-from django.contrib.auth import get_backends, user_login_failed
+from django.conf import settings
+from django.contrib.auth import load_backend, user_login_failed
 from django.core.exceptions import PermissionDenied
 from django.core.handlers.asgi import ASGIRequest
+from django.test.signals import setting_changed
 from django.views.decorators.debug import sensitive_variables
 
+from strawberry_django_jwt2.backends import JSONWebTokenBackend
+
 SENSITIVE_CREDENTIALS = re.compile("api|token|key|secret|password|signature", re.I)
 CLEANSED_SUBSTITUTE = "********************"
 
@@ -26,22 +31,70 @@ def _clean_credentials(credentials):
     return credentials
 
 
+class Backend(NamedTuple):
+    backend: Any
+    path: str
+    signature: inspect.Signature
+    has_authenticate_async: bool
+    is_coroutine: bool
+
+
+_backends = None
+
+
+def get_backends():
+    """
+    Return the `AUTHENTICATION_BACKENDS` instances along with their
+    introspected `authenticate` methods, built once per backends setting.
+    """
+    global _backends
+
+    paths = tuple(settings.AUTHENTICATION_BACKENDS)
+
+    if _backends is None or _backends[0] != paths:
+        backends = []
+
+        for path in paths:
+            backend = load_backend(path)
+            backends.append(
+                Backend(
+                    backend=backend,
+                    path=f"{backend.__module__}.{backend.__class__.__qualname__}",
+                    signature=inspect.signature(backend.authenticate),
+                    has_authenticate_async=hasattr(backend, "authenticate_async"),
+                    is_coroutine=asyncio.iscoroutinefunction(backend.authenticate),
+                )
+            )
+        _backends = paths, backends
+    return _backends[1]
+
+
+def reload_backends(*args, **kwargs):
+    global _backends
+
+    if kwargs["setting"] == "AUTHENTICATION_BACKENDS":
+        _backends = None
+
+
+setting_changed.connect(reload_backends)
+
+
 @sensitive_variables("credentials")
 async def authenticate(request=None, **credentials):
     """
     If the given credentials are valid, return a User object.
     """
-    for backend in get_backends():
-        backend_signature = inspect.signature(backend.authenticate)
+    for entry in get_backends():
+        backend = entry.backend
         try:
-            backend_signature.bind(request, **credentials)
+            entry.signature.bind(request, **credentials)
         except TypeError:
             # This backend doesn't accept these credentials as arguments. Try the next one.
             continue
         try:
-            if hasattr(backend, "authenticate_async"):
+            if entry.has_authenticate_async:
                 user = await backend.authenticate_async(request, **credentials)
-            elif asyncio.iscoroutinefunction(backend.authenticate):
+            elif entry.is_coroutine:
                 user = await backend.authenticate(request, **credentials)
             else:
                 if isinstance(request, ASGIRequest):
@@ -54,10 +107,35 @@ async def authenticate(request=None, **credentials):
         if user is None:
             continue
         # Annotate the user object with the path of the backend.
-        user.backend = f"{backend.__module__}.{backend.__class__.__qualname__}"
+        user.backend = entry.path
         return user
 
     # The credentials supplied are invalid to all backends, fire signal
     user_login_failed.send(sender=__name__, credentials=_clean_credentials(credentials), request=request)
 
     return None
+
+
+def _token_authenticated(user, request, credentials):
+    if user is None:
+        user_login_failed.send(sender=__name__, credentials=_clean_credentials(credentials), request=request)
+        return None
+
+    user.backend = f"{JSONWebTokenBackend.__module__}.{JSONWebTokenBackend.__qualname__}"
+    return user
+
+
+@sensitive_variables("credentials")
+def authenticate_token(request=None, **credentials):
+    """
+    Authenticate the request token with `JSONWebTokenBackend` alone, without
+    going through `AUTHENTICATION_BACKENDS`.
+    """
+    user = JSONWebTokenBackend().authenticate(request, **credentials)
+    return _token_authenticated(user, request, credentials)
+
+
+@sensitive_variables("credentials")
+async def authenticate_token_async(request=None, **credentials):
+    user = await JSONWebTokenBackend().authenticate_async(request, **credentials)
+    return _token_authenticated(user, request, credentials)
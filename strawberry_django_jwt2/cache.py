@@ -0,0 +1,284 @@
+from collections import OrderedDict
+import copy
+import dataclasses
+from hashlib import sha256
+from threading import Lock
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models.signals import post_delete, post_save
+from django.test.signals import setting_changed
+
+from strawberry_django_jwt2 import object_types
+from strawberry_django_jwt2.settings import jwt_settings
+
+__all__ = [
+    "PayloadCache",
+    "SharedPayloadCache",
+    "payload_cache",
+    "shared_payload_cache",
+    "get_cached_payload",
+    "cache_payload",
+    "get_cached_user",
+    "cache_user",
+    "invalidate_user",
+]
+
+
+def token_digest(token):
+    if isinstance(token, str):
+        token = token.encode("utf8")
+    return sha256(token).digest()
+
+
+def payload_expires(payload, now):
+    expires = now + jwt_settings.JWT_PAYLOAD_CACHE_TIMEOUT.total_seconds()
+    exp = getattr(payload, "exp", None)
+
+    if exp:
+        return min(expires, exp)
+    return expires
+
+
+class PayloadCache:
+    """
+    Bounded LRU cache of verified token payloads keyed by token digest.
+
+    Entries never outlive the `exp` claim of their token, expired tokens are
+    therefore always decoded (and rejected) again.
+    """
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: hits={self.hits} misses={self.misses} size={len(self)}>"
+
+    def get(self, token):
+        key = token_digest(token)
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and entry[0] > time.time():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.copy(entry[1])
+
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+        return None
+
+    def set(self, token, payload):
+        now = time.time()
+        expires = payload_expires(payload, now)
+
+        if expires <= now:
+            return
+
+        key = token_digest(token)
+
+        with self._lock:
+            self._entries[key] = (expires, copy.copy(payload))
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > jwt_settings.JWT_PAYLOAD_CACHE_SIZE:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def key_fingerprint(key):
+    if isinstance(key, str):
+        return key.encode("utf8")
+
+    if isinstance(key, bytes):
+        return key
+
+    # Key objects from `cryptography`, private keys are reduced to their public half
+    public_key = key.public_key() if hasattr(key, "public_key") else key
+
+    if hasattr(public_key, "public_bytes"):
+        from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+
+        return public_key.public_bytes(Encoding.DER, PublicFormat.SubjectPublicKeyInfo)
+    return repr(key).encode("utf8")
+
+
+def verification_fingerprint(payload_type):
+    """
+    Digest of everything a cached payload was verified against, entries
+    stored under another configuration are never read.
+    """
+    parts = [
+        jwt_settings.JWT_ALGORITHM,
+        key_fingerprint(jwt_settings.JWT_PUBLIC_KEY or jwt_settings.JWT_SECRET_KEY),
+        jwt_settings.JWT_KEY_ID,
+        sorted((kid, key_fingerprint(key)) for kid, key in jwt_settings.JWT_KEY_RING.items()),
+        jwt_settings.JWT_JWKS_FILE,
+        jwt_settings.JWT_AUDIENCE,
+        jwt_settings.JWT_ISSUER,
+        jwt_settings.JWT_VERIFY,
+        jwt_settings.JWT_VERIFY_EXPIRATION,
+        sorted(field.name for field in dataclasses.fields(payload_type)),
+    ]
+    return sha256(repr(parts).encode("utf8")).hexdigest()[:16]
+
+
+class SharedPayloadCache:
+    """
+    Verified token payloads stored as plain dicts in the Django cache named
+    by `JWT_PAYLOAD_CACHE`, shared by every process using that cache.
+
+    Keys include a fingerprint of the verification settings, rotating a key
+    or changing the payload fields leaves the previous entries unused.
+    """
+
+    key_prefix = "strawberry_django_jwt2:payload:"
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._fingerprint = None
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: hits={self.hits} misses={self.misses}>"
+
+    @property
+    def cache(self):
+        return caches[jwt_settings.JWT_PAYLOAD_CACHE]
+
+    def fingerprint(self, payload_type):
+        if self._fingerprint is None or self._fingerprint[0] is not payload_type:
+            self._fingerprint = payload_type, verification_fingerprint(payload_type)
+        return self._fingerprint[1]
+
+    def key(self, token, payload_type):
+        return f"{self.key_prefix}{self.fingerprint(payload_type)}:{token_digest(token).hex()}"
+
+    def get(self, token, payload_type):
+        data = self.cache.get(self.key(token, payload_type))
+
+        if data is not None:
+            try:
+                payload = payload_type(**data)
+            except TypeError:
+                pass
+            else:
+                self.hits += 1
+                return payload
+
+        self.misses += 1
+        return None
+
+    def set(self, token, payload):
+        # Only dataclass payloads, as built by the default decode handler, can be rebuilt
+        if not dataclasses.is_dataclass(payload) or isinstance(payload, type):
+            return
+
+        now = time.time()
+        timeout = int(payload_expires(payload, now) - now)
+
+        if timeout > 0:
+            self.cache.set(self.key(token, type(payload)), dataclasses.asdict(payload), timeout)
+
+    def clear(self):
+        self.hits = 0
+        self.misses = 0
+        self._fingerprint = None
+
+
+def get_cached_payload(token):
+    if jwt_settings.JWT_PAYLOAD_CACHE_SIZE:
+        payload = payload_cache.get(token)
+
+        if payload is not None:
+            return payload
+
+    if jwt_settings.JWT_PAYLOAD_CACHE is not None:
+        payload = shared_payload_cache.get(token, object_types.TokenPayloadType)
+
+        if payload is not None and jwt_settings.JWT_PAYLOAD_CACHE_SIZE:
+            payload_cache.set(token, payload)
+        return payload
+    return None
+
+
+def cache_payload(token, payload):
+    if jwt_settings.JWT_PAYLOAD_CACHE_SIZE:
+        payload_cache.set(token, payload)
+
+    if jwt_settings.JWT_PAYLOAD_CACHE is not None:
+        shared_payload_cache.set(token, payload)
+
+
+def user_key(username):
+    return "strawberry_django_jwt2:user:" + token_digest(str(username)).hex()
+
+
+def user_pk_key(pk):
+    return f"strawberry_django_jwt2:user-pk:{pk}"
+
+
+def get_cached_user(username):
+    if jwt_settings.JWT_USER_CACHE is None:
+        return None
+    return caches[jwt_settings.JWT_USER_CACHE].get(user_key(username))
+
+
+def cache_user(username, user):
+    if jwt_settings.JWT_USER_CACHE is None:
+        return
+
+    cache = caches[jwt_settings.JWT_USER_CACHE]
+    timeout = jwt_settings.JWT_USER_CACHE_TIMEOUT.total_seconds()
+    key = user_key(username)
+    # Remember the key by primary key so renamed users can be invalidated too
+    cache.set_many({key: user, user_pk_key(user.pk): key}, timeout)
+
+
+def invalidate_user(user):
+    if jwt_settings.JWT_USER_CACHE is None:
+        return
+
+    cache = caches[jwt_settings.JWT_USER_CACHE]
+    pk_key = user_pk_key(user.pk)
+    keys = [pk_key, user_key(user.get_username())]
+    cached_key = cache.get(pk_key)
+
+    if cached_key is not None:
+        keys.append(cached_key)
+    cache.delete_many(keys)
+
+
+def invalidate_user_handler(sender, instance, **kwargs):
+    invalidate_user(instance)
+
+
+def reload_payload_cache(*args, **kwargs):
+    setting = kwargs["setting"]
+
+    if setting in ("GRAPHQL_JWT", "SECRET_KEY"):
+        payload_cache.clear()
+        shared_payload_cache.clear()
+
+
+setting_changed.connect(reload_payload_cache)
+# Lazy sender, receivers without sender would disable fast deletes of every model
+post_save.connect(invalidate_user_handler, sender=settings.AUTH_USER_MODEL, dispatch_uid="strawberry_django_jwt2_user_saved")
+post_delete.connect(invalidate_user_handler, sender=settings.AUTH_USER_MODEL, dispatch_uid="strawberry_django_jwt2_user_deleted")
+
+payload_cache = PayloadCache()
+shared_payload_cache = SharedPayloadCache()
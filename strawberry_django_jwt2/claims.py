@@ -0,0 +1,118 @@
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.utils.translation import gettext as _
+
+from strawberry_django_jwt2 import exceptions
+from strawberry_django_jwt2.settings import jwt_settings
+from strawberry_django_jwt2.utils import get_user_by_payload
+
+__all__ = ["ClaimsUser", "get_claims_user", "get_token_perms", "set_token_perms", "has_token_perms"]
+
+
+class ClaimsUser:
+    """
+    Lightweight user built from the claims of a verified token.
+
+    The database user is only loaded when an attribute that is not part of
+    the claims is accessed. Use `aload` beforehand in async resolvers.
+    """
+
+    is_active = True
+    is_anonymous = False
+    is_authenticated = True
+
+    def __init__(self, payload):
+        user_model = get_user_model()
+        self.USERNAME_FIELD = user_model.USERNAME_FIELD
+        self.pk = self.id = user_model._meta.pk.to_python(payload.userId)
+        self.is_staff = payload.isStaff
+        self.is_superuser = payload.isSuperuser
+        setattr(self, self.USERNAME_FIELD, jwt_settings.JWT_PAYLOAD_GET_USERNAME_HANDLER(payload))
+        self._payload = payload
+        self._user = None
+        self.token_perms = None
+        set_token_perms(self, payload)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {self.get_username()}>"
+
+    def __str__(self):
+        return str(self.get_username())
+
+    def __eq__(self, other):
+        if isinstance(other, ClaimsUser):
+            return self.pk == other.pk
+        if isinstance(other, get_user_model()):
+            return self.pk == other.pk
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.pk)
+
+    def __getattr__(self, name):
+        # Only reached for attributes that are not carried by the claims
+        if name.startswith("__") or name in ("_payload", "_user", "token_perms"):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+    def get_username(self):
+        return getattr(self, self.USERNAME_FIELD)
+
+    def load(self):
+        if self._user is None:
+            user = get_user_by_payload(self._payload)
+
+            if user is None:
+                raise exceptions.JSONWebTokenError(_("Invalid payload"))
+            self._user = user
+        return self._user
+
+    async def aload(self):
+        if self._user is None:
+            await sync_to_async(self.load)()
+        return self._user
+
+    def has_perm(self, perm, obj=None):
+        if self.is_superuser:
+            return True
+        if obj is None and self.token_perms is not None:
+            return has_token_perms(self.token_perms, (perm,))
+        return self.load().has_perm(perm, obj)
+
+    def has_perms(self, perm_list, obj=None):
+        if self.is_superuser:
+            return True
+        if obj is None and self.token_perms is not None:
+            return has_token_perms(self.token_perms, perm_list)
+        return self.load().has_perms(perm_list, obj)
+
+    def has_module_perms(self, app_label):
+        if self.is_superuser:
+            return True
+        return self.load().has_module_perms(app_label)
+
+
+def get_claims_user(payload):
+    if not getattr(payload, "userId", None):
+        return None
+    return ClaimsUser(payload)
+
+
+ALL_PERMS = "*"
+
+
+def set_token_perms(user, payload):
+    """Attach the permissions embedded in `payload` to `user`, if any."""
+    perms = getattr(payload, "perms", None)
+
+    if jwt_settings.JWT_EMBED_PERMISSIONS and perms is not None:
+        user.token_perms = frozenset(perms)
+    return user
+
+
+def get_token_perms(user):
+    return getattr(user, "token_perms", None)
+
+
+def has_token_perms(token_perms, perm_list):
+    return ALL_PERMS in token_perms or all(perm in token_perms for perm in perm_list)
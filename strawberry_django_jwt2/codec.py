@@ -0,0 +1,192 @@
+import json
+import os
+import time
+
+from django.test.signals import setting_changed
+import jwt
+from jwt.algorithms import get_default_algorithms
+from packaging.version import parse as parse_ver
+
+from strawberry_django_jwt2.settings import jwt_settings
+
+__all__ = ["JSONWebKeySet", "TokenCodec", "get_token_codec"]
+
+PYJWT_1 = parse_ver(jwt.__version__) < parse_ver("2.0.0")  # type: ignore
+
+
+def prepare_key(algorithm, key):
+    """Load `key` once into the object PyJWT would build on every call."""
+    try:
+        return get_default_algorithms()[algorithm].prepare_key(key)
+    except (KeyError, ValueError, TypeError, jwt.InvalidKeyError):
+        # Leave invalid keys and unknown algorithms for PyJWT to report when used
+        return key
+
+
+class JSONWebKeySet:
+    """
+    Verifying keys read from a JWKS document on disk, indexed by `kid`.
+
+    The file modification time is checked at most once per
+    `refresh_interval` seconds and the keys are only parsed again when it
+    changed. A document that cannot be read keeps the previous keys in use
+    and entries that fail to load are skipped.
+    """
+
+    def __init__(self, path, default_algorithm, refresh_interval):
+        self.path = path
+        self.default_algorithm = default_algorithm
+        self.refresh_interval = refresh_interval
+        self.keys = {}
+        self._mtime = None
+        self._checked = None
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {self.path} ({len(self.keys)} keys)>"
+
+    def get(self, kid):
+        self.refresh()
+        return self.keys.get(kid)
+
+    def refresh(self):
+        now = time.monotonic()
+
+        if self._checked is not None and now - self._checked < self.refresh_interval:
+            return
+
+        self._checked = now
+
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+
+            if mtime != self._mtime:
+                self.keys = self.load()
+                self._mtime = mtime
+        except (OSError, ValueError, jwt.PyJWTError):
+            pass
+
+    def load(self):
+        with open(self.path, encoding="utf8") as jwks:
+            data = json.load(jwks)
+
+        if not isinstance(data, dict):
+            raise ValueError("Invalid JWKS document")
+
+        algorithms = get_default_algorithms()
+        keys = {}
+
+        for jwk in data.get("keys", ()):
+            if not isinstance(jwk, dict):
+                continue
+
+            kid = jwk.get("kid")
+            algorithm = jwk.get("alg", self.default_algorithm)
+
+            # Unsigned tokens are never accepted, whatever the key set says
+            if kid is None or jwk.get("use", "sig") != "sig" or algorithm == "none" or algorithm not in algorithms:
+                continue
+
+            try:
+                keys[kid] = algorithms[algorithm].from_jwk(json.dumps(jwk)), [algorithm]
+            except (KeyError, NotImplementedError, ValueError, jwt.PyJWTError):
+                continue
+        return keys
+
+
+class TokenCodec:
+    """
+    Keys and options used by `jwt_encode` and `jwt_decode`, built once from
+    the current `jwt_settings`.
+    """
+
+    def __init__(self):
+        self.algorithm = jwt_settings.JWT_ALGORITHM
+        self.algorithms = [self.algorithm]
+        self.signing_key = prepare_key(self.algorithm, jwt_settings.JWT_PRIVATE_KEY or jwt_settings.JWT_SECRET_KEY)
+        self.verifying_key = prepare_key(self.algorithm, jwt_settings.JWT_PUBLIC_KEY or jwt_settings.JWT_SECRET_KEY)
+        self.headers = {"kid": jwt_settings.JWT_KEY_ID} if jwt_settings.JWT_KEY_ID else None
+        # Verifying keys by `kid`, the current key is always part of the ring
+        self.key_ring = {kid: prepare_key(self.algorithm, key) for kid, key in jwt_settings.JWT_KEY_RING.items()}
+
+        if jwt_settings.JWT_KEY_ID:
+            self.key_ring.setdefault(jwt_settings.JWT_KEY_ID, self.verifying_key)
+
+        self.key_set = None
+
+        if jwt_settings.JWT_JWKS_FILE is not None:
+            self.key_set = JSONWebKeySet(
+                jwt_settings.JWT_JWKS_FILE,
+                self.algorithm,
+                jwt_settings.JWT_JWKS_REFRESH_INTERVAL.total_seconds(),
+            )
+        self.options = {
+            "verify_exp": jwt_settings.JWT_VERIFY_EXPIRATION,
+            "verify_aud": jwt_settings.JWT_AUDIENCE is not None,
+            "verify_signature": jwt_settings.JWT_VERIFY,
+        }
+        self.leeway = jwt_settings.JWT_LEEWAY
+        self.audience = jwt_settings.JWT_AUDIENCE
+        self.issuer = jwt_settings.JWT_ISSUER
+
+    def encode(self, payload):
+        token = jwt.encode(payload, self.signing_key, self.algorithm, headers=self.headers)
+
+        if PYJWT_1:
+            return token.decode("utf8")
+        return token
+
+    def get_verifying_key(self, token):
+        """Return the verifying key and accepted algorithms for `token`."""
+        if not self.key_ring and self.key_set is None:
+            return self.verifying_key, self.algorithms
+
+        kid = jwt.get_unverified_header(token).get("kid")
+
+        if kid is None:
+            return self.verifying_key, self.algorithms
+
+        if not isinstance(kid, str):
+            raise jwt.InvalidTokenError("Invalid key id")
+
+        if kid in self.key_ring:
+            return self.key_ring[kid], self.algorithms
+
+        if self.key_set is not None:
+            key = self.key_set.get(kid)
+
+            if key is not None:
+                return key
+        raise jwt.InvalidTokenError("Unknown key id")
+
+    def decode(self, token):
+        key, algorithms = self.get_verifying_key(token)
+        return jwt.decode(
+            token,
+            key,
+            options=self.options,
+            leeway=self.leeway,
+            audience=self.audience,
+            issuer=self.issuer,
+            algorithms=algorithms,
+        )
+
+
+_token_codec = None
+
+
+def get_token_codec():
+    global _token_codec
+
+    if _token_codec is None:
+        _token_codec = TokenCodec()
+    return _token_codec
+
+
+def reload_token_codec(*args, **kwargs):
+    global _token_codec
+
+    if kwargs["setting"] in ("GRAPHQL_JWT", "SECRET_KEY"):
+        _token_codec = None
+
+
+setting_changed.connect(reload_token_codec)
@@ -3,7 +3,6 @@ from datetime import datetime
 from functools import wraps
 import inspect
 
-from asgiref.sync import sync_to_async
 from django.contrib.auth import get_user_model
 import django.contrib.auth.base_user
 from django.core.handlers.asgi import ASGIRequest
@@ -15,13 +14,16 @@ from strawberry.types import Info
 
 from strawberry_django_jwt2 import exceptions, signals
 from strawberry_django_jwt2.auth import authenticate
+from strawberry_django_jwt2.claims import get_token_perms, has_token_perms
 from strawberry_django_jwt2.refresh_token.shortcuts import (
+    acreate_refresh_token,
     create_refresh_token,
     refresh_token_lazy,
     refresh_token_lazy_async,
 )
 from strawberry_django_jwt2.settings import jwt_settings
 from strawberry_django_jwt2.utils import (
+    create_payload_async,
     delete_cookie,
     get_context,
     maybe_thenable,
@@ -75,6 +77,23 @@ def context(func):
     return wrapper
 
 
+def passes_test(context, test_func):
+    """
+    Return `test_func(context.user)`, remembered on the request for the
+    current user so list items do not re-run the same check.
+    """
+    user = context.user
+    key = test_func, type(user), getattr(user, "pk", None)
+    results = getattr(context, "_jwt_test_results", None)
+
+    if results is None:
+        results = context._jwt_test_results = {}
+
+    if key not in results:
+        results[key] = test_func(user)
+    return results[key]
+
+
 def user_passes_test(test_func, exc=exceptions.PermissionDenied):
     def decorator(f):
         # get_result is used by strawberry-graphql-django model mutations
@@ -85,12 +104,13 @@ def user_passes_test(test_func, exc=exceptions.PermissionDenied):
             return f
 
         f_with_info = with_info(f)
+        resolver = dispose_extra_kwargs(f_with_info)
 
         @wraps(f_with_info)
         @context
         def wrapper(context, *args, **kwargs):
-            if context and test_func(context.user):
-                return dispose_extra_kwargs(f_with_info)(*args, **kwargs)
+            if context and passes_test(context, test_func):
+                return resolver(*args, **kwargs)
             raise exc
 
         return wrapper
@@ -107,15 +127,30 @@ def login_field(fn=None):
     return strawberry.field(login_required(fn))
 
 
-def permission_required(perm):
-    def check_perms(user):
-        if isinstance(perm, str):
-            perms = (perm,)
-        else:
-            perms = perm
-        return user.has_perms(perms)
+class HasPerms:
+    """Permission test, equal to any other test of the same permissions."""
+
+    def __init__(self, perms):
+        self.perms = perms
+
+    def __call__(self, user):
+        token_perms = get_token_perms(user)
 
-    return user_passes_test(check_perms)
+        # Permissions embedded in the token spare the permission queries
+        if token_perms is not None:
+            return has_token_perms(token_perms, self.perms)
+        return user.has_perms(self.perms)
+
+    def __eq__(self, other):
+        return isinstance(other, HasPerms) and self.perms == other.perms
+
+    def __hash__(self):
+        return hash(self.perms)
+
+
+def permission_required(perm):
+    perms = (perm,) if isinstance(perm, str) else tuple(perm)
+    return user_passes_test(HasPerms(perms))
 
 
 def on_token_auth_resolve(values):
@@ -137,12 +172,12 @@ def on_token_auth_resolve(values):
 async def on_token_auth_resolve_async(values):
     info, user, payload = values
     ctx = get_context(info)
-    payload.payload = jwt_settings.JWT_PAYLOAD_HANDLER(user, ctx)
+    payload.payload = await create_payload_async(user, ctx)
     payload.token = jwt_settings.JWT_ENCODE_HANDLER(payload.payload, ctx)
 
     if jwt_settings.JWT_LONG_RUNNING_REFRESH_TOKEN:
         if getattr(ctx, "jwt_cookie", False):
-            ctx.jwt_refresh_token = await sync_to_async(create_refresh_token)(user)
+            ctx.jwt_refresh_token = await acreate_refresh_token(user)
             payload.refresh_token = ctx.jwt_refresh_token.get_token()
         else:
             payload.refresh_token = await refresh_token_lazy_async(user)
@@ -307,16 +342,19 @@ def ensure_token(f):
 
 
 def dispose_extra_kwargs(fn):
+    present = frozenset(inspect.signature(fn).parameters)
+
     @wraps(fn)
     def wrapper(src, *args_, **kwargs_):
         root = {}
+        passed_kwargs = {}
         if src:
             args_ = args_[1:]
-        present = inspect.signature(fn).parameters.keys()
         for key, val in kwargs_.items():
-            if key not in present:
+            if key in present:
+                passed_kwargs[key] = val
+            else:
                 root[key] = val
-        passed_kwargs = {k: v for k, v in kwargs_.items() if k in present}
         if src:
             return fn(src, root, *args_, **passed_kwargs)
         if not root:
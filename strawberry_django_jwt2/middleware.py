@@ -1,16 +1,27 @@
 from inspect import isawaitable
-from typing import Any, Set, cast
+from typing import Any, Dict, Optional, Set, Tuple, cast
+from weakref import WeakKeyDictionary
 
 from django.contrib.auth import authenticate
 from django.contrib.auth.middleware import get_user
 from django.contrib.auth.models import AnonymousUser
+from django.test.signals import setting_changed
 from django.utils.translation import gettext as _
-from graphql import GraphQLResolveInfo, GraphQLType
+from graphql import (
+    GraphQLInterfaceType,
+    GraphQLObjectType,
+    GraphQLResolveInfo,
+    GraphQLSchema,
+    GraphQLType,
+    get_named_type,
+    is_leaf_type,
+)
 from strawberry.extensions import Extension
 from strawberry.types import ExecutionContext
 
 from strawberry_django_jwt2 import exceptions
 from strawberry_django_jwt2.auth import authenticate as authenticate_async
+from strawberry_django_jwt2.auth import authenticate_token, authenticate_token_async
 from strawberry_django_jwt2.path import PathDict
 from strawberry_django_jwt2.settings import jwt_settings
 from strawberry_django_jwt2.utils import (
@@ -26,8 +37,8 @@ __all__ = [
 ]
 
 
-def allow_any(info, **kwargs):
-    field = info.parent_type.fields.get(info.field_name)
+def field_allows_any(parent_type, field_name):
+    field = parent_type.fields.get(field_name)
 
     if field is None:
         return False
@@ -39,6 +50,98 @@ def allow_any(info, **kwargs):
     )
 
 
+_allow_any_tables: "WeakKeyDictionary[GraphQLSchema, Dict[Tuple[str, str], bool]]" = WeakKeyDictionary()
+
+
+def get_allow_any_table(schema):
+    """
+    Return the allow any decision of every object and interface field of
+    `schema`, keyed by (parent type name, field name).
+    """
+    if not isinstance(schema, GraphQLSchema):
+        return None
+
+    table = _allow_any_tables.get(schema)
+
+    if table is None:
+        table = {}
+
+        for type_name, named_type in schema.type_map.items():
+            if isinstance(named_type, (GraphQLObjectType, GraphQLInterfaceType)):
+                for field_name in named_type.fields:
+                    table[type_name, field_name] = field_allows_any(named_type, field_name)
+        _allow_any_tables[schema] = table
+    return table
+
+
+_skip_tables: "WeakKeyDictionary[GraphQLSchema, Dict[Tuple[str, str], bool]]" = WeakKeyDictionary()
+
+
+def is_plain_field(field):
+    """Whether `field` only reads an attribute of its parent value."""
+    definition = field.extensions.get("strawberry-definition") if field.extensions else None
+    return definition is not None and definition.base_resolver is None and not definition.extensions and not definition.permission_classes
+
+
+def field_needs_auth(field):
+    """
+    Whether a nested `field` needs the middleware, only plain leaf fields can
+    reuse the authentication of their root field.
+    """
+    if jwt_settings.JWT_ALLOW_ARGUMENT and (jwt_settings.JWT_ARGUMENT_NAME in field.args or "input" in field.args):
+        return True
+
+    # Resolvers may read the user, which allow any root fields leave unauthenticated
+    return not (is_leaf_type(get_named_type(field.type)) and is_plain_field(field))
+
+
+def root_key(path):
+    while path.prev is not None:
+        path = path.prev
+    return path.key
+
+
+def get_skip_table(schema):
+    """
+    Return, keyed by (parent type name, field name), whether the middleware
+    can be skipped when resolving the field below a root field.
+    """
+    if not isinstance(schema, GraphQLSchema):
+        return None
+
+    table = _skip_tables.get(schema)
+
+    if table is None:
+        table = {}
+
+        for type_name, named_type in schema.type_map.items():
+            if isinstance(named_type, (GraphQLObjectType, GraphQLInterfaceType)):
+                for field_name, field in named_type.fields.items():
+                    table[type_name, field_name] = not field_needs_auth(field)
+        _skip_tables[schema] = table
+    return table
+
+
+def reload_schema_tables(*args, **kwargs):
+    if kwargs["setting"] == "GRAPHQL_JWT":
+        _allow_any_tables.clear()
+        _skip_tables.clear()
+
+
+setting_changed.connect(reload_schema_tables)
+
+
+def allow_any(info, **kwargs):
+    table = get_allow_any_table(info.schema)
+
+    if table is not None:
+        allowed = table.get((info.parent_type.name, info.field_name))
+
+        if allowed is not None:
+            return allowed
+    return field_allows_any(info.parent_type, info.field_name)
+
+
 def _authenticate(request):
     is_anonymous = not hasattr(request, "user") or request.user.is_anonymous
     return is_anonymous and get_http_authorization(request) is not None
@@ -48,10 +151,55 @@ class BaseJSONWebTokenMiddleware(Extension):
     def __init__(self, *, execution_context: ExecutionContext):
         super().__init__(execution_context=execution_context)
         self.cached_allow_any: Set[Any] = set()
+        self.operation_authenticated = False
+        self.operation_credentials = False
+        self.operation_error: Optional[exceptions.JSONWebTokenError] = None
+        # Root fields that authenticated the request, see skip_field()
+        self.authenticated_roots: Set[Any] = set()
 
         if jwt_settings.JWT_ALLOW_ARGUMENT:
             self.cached_authentication = PathDict()
 
+    def operation_context(self):
+        """
+        Return the request whose credentials are authenticated once for the
+        whole operation, or None when fields are authenticated one by one.
+        """
+        # Token arguments are bound to single fields and need the per-field path
+        if not jwt_settings.JWT_AUTHENTICATE_PER_OPERATION or jwt_settings.JWT_ALLOW_ARGUMENT:
+            return None
+
+        context = get_context(self.execution_context)
+        self.operation_authenticated = True
+        self.operation_credentials = _authenticate(context)
+        return context if self.operation_credentials else None
+
+    def resolve_operation(self, info: GraphQLResolveInfo, **kwargs):
+        # Errors are raised once per root field, nested fields inherit the outcome
+        if info.path.prev is not None:
+            return
+
+        if self.operation_error is not None:
+            if self.authenticate_context(info, **kwargs):
+                raise self.operation_error
+        elif not self.operation_credentials:
+            self.check_introspection(info, **kwargs)
+
+    def skip_field(self, info: GraphQLResolveInfo):
+        if not jwt_settings.JWT_MIDDLEWARE_SKIP_LEAF_FIELDS or info.path.prev is None:
+            return False
+
+        table = get_skip_table(info.schema)
+
+        if table is None or not table.get((info.parent_type.name, info.field_name), False):
+            return False
+        return root_key(info.path) in self.authenticated_roots
+
+    def mark_root(self, info: GraphQLResolveInfo, **kwargs):
+        # Allow any root fields skip authentication, their nested fields cannot skip it too
+        if jwt_settings.JWT_MIDDLEWARE_SKIP_LEAF_FIELDS and info.path.prev is None and not jwt_settings.JWT_ALLOW_ANY_HANDLER(info, **kwargs):
+            self.authenticated_roots.add(info.path.key)
+
     def authenticate_context(self, info: GraphQLResolveInfo, **kwargs):
         root_path = info.path[0]
 
@@ -81,7 +229,12 @@ class BaseJSONWebTokenMiddleware(Extension):
 
         if (_authenticate(context) or token_argument is not None) and self.authenticate_context(info, **kwargs):
             return context, token_argument
-        elif (
+
+        self.check_introspection(info, **kwargs)
+        return context, token_argument
+
+    def check_introspection(self, info: GraphQLResolveInfo, **kwargs):
+        if (
             info.field_name == "__schema"
             and cast(GraphQLResolveInfo, info).parent_type.name == "Query"
             and jwt_settings.JWT_AUTHENTICATE_INTROSPECTION
@@ -90,16 +243,39 @@ class BaseJSONWebTokenMiddleware(Extension):
 
             raise exceptions.PermissionDenied(_("The introspection query requires authentication."))
 
-        return context, token_argument
-
 
 class JSONWebTokenMiddleware(BaseJSONWebTokenMiddleware):
+    def authenticate_request(self, request, **kwargs):
+        if jwt_settings.JWT_MIDDLEWARE_DIRECT_AUTH:
+            return authenticate_token(request=request, **kwargs)
+        return authenticate(request=request, **kwargs)
+
+    def on_execute(self):
+        context = self.operation_context()
+
+        if context is not None:
+            try:
+                user = self.authenticate_request(context)
+            except exceptions.JSONWebTokenError as err:
+                self.operation_error = err
+            else:
+                if user is not None:
+                    context.user = user
+        yield
+
     def resolve(self, _next, root, info: GraphQLResolveInfo, *args, **kwargs):
+        if self.operation_authenticated:
+            self.resolve_operation(info, **kwargs)
+            return _next(root, info, **kwargs)
+
+        if self.skip_field(info):
+            return _next(root, info, **kwargs)
+
         context, token_argument = self.resolve_base(info, **kwargs)
 
         if (_authenticate(context) or token_argument is not None) and self.authenticate_context(info, **kwargs):
 
-            user = authenticate(request=context, **kwargs)
+            user = self.authenticate_request(context, **kwargs)
 
             if user is not None:
                 context.user = user
@@ -107,16 +283,48 @@ class JSONWebTokenMiddleware(BaseJSONWebTokenMiddleware):
                 if jwt_settings.JWT_ALLOW_ARGUMENT:
                     self.cached_authentication.insert(info.path, user)
 
+        self.mark_root(info, **kwargs)
         return _next(root, info, **kwargs)
 
 
 class AsyncJSONWebTokenMiddleware(BaseJSONWebTokenMiddleware):
+    async def authenticate_request(self, request, **kwargs):
+        if jwt_settings.JWT_MIDDLEWARE_DIRECT_AUTH:
+            return await authenticate_token_async(request=request, **kwargs)
+        return await authenticate_async(request=request, **kwargs)
+
+    async def on_execute(self):
+        context = self.operation_context()
+
+        if context is not None:
+            try:
+                user = await self.authenticate_request(context)
+            except exceptions.JSONWebTokenError as err:
+                self.operation_error = err
+            else:
+                if user is not None:
+                    context.user = user
+        yield
+
     async def resolve(self, _next, root, info: GraphQLResolveInfo, *args, **kwargs):
+        if self.operation_authenticated:
+            self.resolve_operation(info, **kwargs)
+            result = _next(root, info, **kwargs)
+            if isawaitable(result):
+                return await result
+            return result
+
+        if self.skip_field(info):
+            result = _next(root, info, **kwargs)
+            if isawaitable(result):
+                return await result
+            return result
+
         context, token_argument = self.resolve_base(info, **kwargs)
 
         if (_authenticate(context) or token_argument is not None) and self.authenticate_context(info, **kwargs):
 
-            user = await authenticate_async(request=context, **kwargs)
+            user = await self.authenticate_request(context, **kwargs)
 
             if user is not None:
                 context.user = user
@@ -124,6 +332,7 @@ class AsyncJSONWebTokenMiddleware(BaseJSONWebTokenMiddleware):
                 if jwt_settings.JWT_ALLOW_ARGUMENT:
                     self.cached_authentication.insert(info.path, user)
 
+        self.mark_root(info, **kwargs)
         result = _next(root, info, **kwargs)
         if isawaitable(result):
             return await result
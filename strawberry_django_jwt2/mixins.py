@@ -24,13 +24,15 @@ from strawberry_django_jwt2.refresh_token import signals as refresh_signals
 from strawberry_django_jwt2.refresh_token.decorators import ensure_refresh_token
 from strawberry_django_jwt2.refresh_token.object_types import RefreshedTokenType
 from strawberry_django_jwt2.refresh_token.shortcuts import (
+    acreate_refresh_token,
+    aget_refresh_token,
     create_refresh_token,
     get_refresh_token,
     refresh_token_lazy,
-    refresh_token_lazy_async,
 )
 from strawberry_django_jwt2.signals import token_refreshed
 from strawberry_django_jwt2.utils import (
+    create_payload_async,
     create_strawberry_argument,
     get_context,
     get_payload,
@@ -120,7 +122,7 @@ class RefreshTokenMixin(JSONWebTokenMixin):
     @csrf_rotation
     @refresh_expiration
     @ensure_refresh_token
-    def _refresh(self, info: Info, refresh_token: Optional[str], _is_async: Optional[bool] = False) -> RefreshedTokenType:
+    def _refresh(self, info: Info, refresh_token: Optional[str]) -> RefreshedTokenType:
         context = get_context(info)
         old_refresh_token = get_refresh_token(refresh_token, context)
 
@@ -140,7 +142,7 @@ class RefreshTokenMixin(JSONWebTokenMixin):
             )
             new_refresh_token = context.jwt_refresh_token.get_token()
         else:
-            new_refresh_token = (refresh_token_lazy_async if _is_async else refresh_token_lazy)(
+            new_refresh_token = refresh_token_lazy(
                 old_refresh_token.user,
                 old_refresh_token,
             )
@@ -153,11 +155,41 @@ class RefreshTokenMixin(JSONWebTokenMixin):
         )
         return RefreshedTokenType(payload=payload, token=token, refresh_token=new_refresh_token, refresh_expires_in=0)
 
+    @staticmethod
+    @setup_jwt_cookie
+    @csrf_rotation
+    @refresh_expiration
+    @ensure_refresh_token
+    async def _refresh_async(self, info: Info, refresh_token: Optional[str]) -> RefreshedTokenType:
+        context = get_context(info)
+        old_refresh_token = await aget_refresh_token(refresh_token, context)
+
+        if old_refresh_token.is_expired(context):
+            raise exceptions.JSONWebTokenError(_("Refresh token is expired"))
+
+        payload = await create_payload_async(old_refresh_token.user, context)
+        token = settings.jwt_settings.JWT_ENCODE_HANDLER(payload, context)
+        new_refresh_token = await acreate_refresh_token(
+            old_refresh_token.user,
+            old_refresh_token,
+        )
+
+        if hasattr(context, "jwt_cookie"):
+            context.jwt_refresh_token = new_refresh_token
+
+        refresh_signals.refresh_token_rotated.send(
+            sender=RefreshMixin,
+            request=context,
+            refresh_token=old_refresh_token,
+            refresh_token_issued=new_refresh_token.get_token(),
+        )
+        return RefreshedTokenType(payload=payload, token=token, refresh_token=new_refresh_token.get_token(), refresh_expires_in=0)
+
     def refresh(self, info: Info, refresh_token: Optional[str] = None) -> RefreshedTokenType:
         return RefreshTokenMixin._refresh(self, info=info, refresh_token=refresh_token)
 
     async def refresh_async(self, info: Info, refresh_token: Optional[str] = None) -> RefreshedTokenType:
-        return await sync_to_async(RefreshTokenMixin._refresh)(self, info=info, refresh_token=refresh_token, _is_async=True)
+        return await RefreshTokenMixin._refresh_async(self, info=info, refresh_token=refresh_token)
 
 
 base_class: Type[Union[RefreshTokenMixin, KeepAliveRefreshMixin]] = (
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional, Tuple, Type, TypeVar
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
 
 from django.contrib.auth import get_user_model
 import strawberry.django
@@ -30,6 +30,8 @@ class DeleteType:
         **({"origIat": (int, 0)} if jwt_settings.JWT_ALLOW_REFRESH else {}),
         **({"aud": (str, "")} if jwt_settings.JWT_AUDIENCE else {}),
         **({"iss": (str, "")} if jwt_settings.JWT_ISSUER else {}),
+        **({"userId": (str, ""), "isStaff": (bool, False), "isSuperuser": (bool, False)} if jwt_settings.JWT_CLAIMS_USER else {}),
+        **({"perms": (Optional[List[str]], None)} if jwt_settings.JWT_EMBED_PERMISSIONS else {}),
     }
 )
 class TokenPayloadType:
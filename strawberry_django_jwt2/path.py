@@ -1,3 +1,5 @@
+from graphql.pyutils import Path
+
 __all__ = ["PathDict"]
 
 
@@ -6,13 +8,33 @@ def filter_strings(items):
 
 
 class PathDict(dict):
+    """
+    Values stored along GraphQL result paths.
+
+    `graphql.pyutils.Path` nodes are looked up by identity, walking up their
+    `prev` links, and every node visited on the way remembers the outcome so
+    siblings and descendants stop at the first memoized node. Other
+    sequences are keyed by their string items.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Node id -> (node, value), the node is kept so its id is not reused
+        self.nodes = {}
+
     def __repr__(self):
         return f"<{self.__class__.__name__}: {super().__repr__()}>"
 
     def insert(self, path, value):
-        self[filter_strings(path)] = value
+        if isinstance(path, Path):
+            self.nodes[id(path)] = path, value
+        else:
+            self[filter_strings(path)] = value
 
     def parent(self, path):
+        if isinstance(path, Path):
+            return self.parent_node(path)
+
         path = filter_strings(path)
 
         for depth in range(len(path) - 1):
@@ -25,3 +47,23 @@ class PathDict(dict):
                     self[path[:-1]] = value
                 return value
         return None
+
+    def parent_node(self, path):
+        node = path.prev
+        visited = []
+        value = None
+
+        while node is not None:
+            entry = self.nodes.get(id(node))
+
+            if entry is not None:
+                value = entry[1]
+                break
+
+            visited.append(node)
+            node = node.prev
+
+        # Ancestors are resolved before their children, misses can be memoized too
+        for node in visited:
+            self.nodes[id(node)] = node, value
+        return value
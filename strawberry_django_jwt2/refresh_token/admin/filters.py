@@ -21,10 +21,10 @@ class ExpiredFilter(BooleanListFilter):
 
     def queryset(self, request, queryset):
         if self.value() == "yes":
-            return queryset.expired().filter(expired=True)
+            return queryset.expired_only()
 
         if self.value() == "no":
-            return queryset.expired().filter(expired=False)
+            return queryset.active_only()
 
         return None
 
@@ -1,5 +1,8 @@
-from django.core.management.base import BaseCommand
-from django.db.models import Q
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models.deletion import Collector
 from django.template.defaultfilters import pluralize
 
 from strawberry_django_jwt2.refresh_token.utils import get_refresh_token_model
@@ -14,16 +17,90 @@ class Command(BaseCommand):
             action="store_true",
             help="Clears expired tokens",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of tokens deleted per transaction",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0,
+            help="Seconds to wait between batches",
+        )
+        parser.add_argument(
+            "--max-runtime",
+            type=float,
+            default=None,
+            help="Stop after this many seconds, remaining tokens are left for the next run",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only count the tokens that would be deleted",
+        )
+
+    def handle(self, expired, *args, batch_size=1000, sleep=0, max_runtime=None, dry_run=False, **options):
+        if batch_size < 1:
+            raise CommandError("--batch-size must be a positive integer")
+
+        if sleep < 0:
+            raise CommandError("--sleep cannot be negative")
 
-    def handle(self, expired, *args, **options):
-        qs = get_refresh_token_model().objects
-        query = Q(revoked__isnull=False)
+        if max_runtime is not None and max_runtime < 0:
+            raise CommandError("--max-runtime cannot be negative")
+
+        qs = get_refresh_token_model().objects.filter(revoked__isnull=False)
 
         if expired:
-            qs = qs.expired()
-            query |= Q(expired=True)
+            qs |= get_refresh_token_model().objects.expired_only()
+
+        if dry_run:
+            count = qs.count()
+            self.stdout.write(f"Would delete {count} token{pluralize(count)}")
+            return
+
+        started = time.monotonic()
+        deleted = 0
+        last_pk = None
+        timed_out = False
+
+        while True:
+            batch = qs if last_pk is None else qs.filter(pk__gt=last_pk)
+            pks = list(batch.order_by("pk").values_list("pk", flat=True)[:batch_size])
+
+            if not pks:
+                break
+
+            last_pk = pks[-1]
+            deleted += self.delete_batch(pks)
 
-        deleted, _ = qs.filter(query).delete()
+            if len(pks) < batch_size:
+                break
 
-        msg = f"Successfully deleted {deleted} token{pluralize(deleted)}"
+            if max_runtime is not None and time.monotonic() - started >= max_runtime:
+                timed_out = True
+                break
+
+            if sleep:
+                time.sleep(sleep)
+
+        elapsed = time.monotonic() - started
+        rate = deleted / elapsed if elapsed else deleted
+        msg = f"Successfully deleted {deleted} token{pluralize(deleted)} ({rate:.0f} tokens/s)"
         self.stdout.write(self.style.SUCCESS(msg))
+
+        if timed_out:
+            self.stdout.write(self.style.WARNING("Stopped after reaching --max-runtime"))
+
+    def delete_batch(self, pks):
+        qs = get_refresh_token_model().objects.filter(pk__in=pks)
+
+        with transaction.atomic(using=qs.db):
+            # Skip the collector when no signal receivers or relations depend on the rows
+            if Collector(using=qs.db).can_fast_delete(qs):
+                return qs._raw_delete(qs.db)
+
+            deleted, _ = qs.delete()
+        return deleted
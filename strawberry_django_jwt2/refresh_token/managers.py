@@ -1,15 +1,20 @@
+import binascii
+import os
+
 from django.db import models
-from django.db.models import Case
+from django.db.models import Case, F
 from django.db.models import Value as Val
-from django.db.models import When
+from django.db.models import When, Window
+from django.db.models.functions import Rank
 from django.utils import timezone
 
+from strawberry_django_jwt2.refresh_token.utils import hash_token
 from strawberry_django_jwt2.settings import jwt_settings
 
 
 class RefreshTokenQuerySet(models.QuerySet):
     def expired(self):
-        expires = timezone.now() - jwt_settings.JWT_REFRESH_EXPIRATION_DELTA
+        expires = self.expiration_limit()
         return self.annotate(
             expired=Case(
                 When(created__lt=expires, then=Val(True)),
@@ -17,3 +22,57 @@ class RefreshTokenQuerySet(models.QuerySet):
                 default=Val(False),
             ),
         )
+
+    def expiration_limit(self):
+        return timezone.now() - jwt_settings.JWT_REFRESH_EXPIRATION_DELTA
+
+    def expired_only(self):
+        # Compares the indexed column directly, unlike filtering on expired()
+        return self.filter(created__lt=self.expiration_limit())
+
+    def active_only(self):
+        return self.filter(created__gte=self.expiration_limit())
+
+    def build_many(self, users):
+        """
+        Return unsaved refresh tokens for `users`, all token values are drawn
+        from a single `os.urandom` call.
+        """
+        users = list(users)
+        n_bytes = jwt_settings.JWT_REFRESH_TOKEN_N_BYTES
+        random = binascii.hexlify(os.urandom(n_bytes * len(users))).decode()
+        refresh_tokens = []
+
+        for index, user in enumerate(users):
+            token = random[index * n_bytes * 2 : (index + 1) * n_bytes * 2]
+            refresh_token = self.model(user=user, token=token, token_hash=hash_token(token))
+            refresh_token._cached_token = token
+            refresh_tokens.append(refresh_token)
+        return refresh_tokens
+
+    def issue_many(self, users):
+        """
+        Create one refresh token per distinct user in a single INSERT and
+        return the token values mapped to their users.
+        """
+        users = list(dict.fromkeys(users))
+        refresh_tokens = self.bulk_create(self.build_many(users))
+        return {refresh_token.user: refresh_token.get_token() for refresh_token in refresh_tokens}
+
+    def prune(self, users, keep):
+        """
+        Delete the tokens of `users` older than their `keep` most recent ones.
+
+        The tokens to delete are ranked per user in a single SELECT and removed
+        by primary key, MySQL cannot DELETE from a table it reads in a subquery.
+        """
+        if keep < 1:
+            raise ValueError("keep must be at least 1, the newest token of each user is always kept")
+
+        # Tokens created at the same instant as the oldest kept one share its rank and are kept too
+        ranked = self.filter(user__in=users).annotate(rank=Window(Rank(), partition_by=[F("user")], order_by=F("created").desc()))
+        pks = [pk for pk, rank in ranked.values_list("pk", "rank") if rank > keep]
+
+        if not pks:
+            return 0, {}
+        return self.filter(pk__in=pks).delete()
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("refresh_token", "0002_auto_20190130_0900"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="refreshtoken",
+            name="token_hash",
+            field=models.CharField(default="", editable=False, max_length=64, verbose_name="token hash"),
+        ),
+    ]
@@ -0,0 +1,34 @@
+from hashlib import sha256
+
+from django.db import migrations, transaction
+
+
+def hash_tokens(apps, schema_editor):
+    RefreshToken = apps.get_model("refresh_token", "RefreshToken")
+    alias = schema_editor.connection.alias
+    objects = RefreshToken.objects.using(alias)
+
+    while True:
+        # Each batch commits on its own so large tables are not locked for the whole backfill
+        with transaction.atomic(using=alias):
+            # Hashed rows drop out of the filter, each batch starts from the first pending row
+            batch = list(objects.filter(token_hash="").only("pk", "token").order_by("pk")[:2000])
+
+            if not batch:
+                break
+
+            for refresh_token in batch:
+                refresh_token.token_hash = sha256(refresh_token.token.encode("utf8")).hexdigest()
+            objects.bulk_update(batch, ["token_hash"])
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("refresh_token", "0003_refreshtoken_token_hash"),
+    ]
+
+    operations = [
+        migrations.RunPython(hash_tokens, migrations.RunPython.noop),
+    ]
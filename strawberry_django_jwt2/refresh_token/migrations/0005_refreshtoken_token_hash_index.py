@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("refresh_token", "0004_refreshtoken_hash_tokens"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="refreshtoken",
+            name="token_hash",
+            field=models.CharField(db_index=True, default="", editable=False, max_length=64, verbose_name="token hash"),
+        ),
+        migrations.AddIndex(
+            model_name="refreshtoken",
+            index=models.Index(condition=models.Q(("revoked__isnull", True)), fields=["token_hash"], name="refresh_token_refreshtoken_ah"),
+        ),
+    ]
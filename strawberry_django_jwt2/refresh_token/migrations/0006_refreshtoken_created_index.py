@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("refresh_token", "0005_refreshtoken_token_hash_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="refreshtoken",
+            name="created",
+            field=models.DateTimeField(auto_now_add=True, db_index=True, verbose_name="created"),
+        ),
+    ]
@@ -0,0 +1,14 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("refresh_token", "0006_refreshtoken_created_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="refreshtoken",
+            index=models.Index(fields=["user", "created"], name="refresh_token_refreshtoken_uc"),
+        ),
+    ]
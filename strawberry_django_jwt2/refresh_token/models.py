@@ -2,12 +2,14 @@ import binascii
 from calendar import timegm
 import os
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.db import models
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from strawberry_django_jwt2.refresh_token import managers, signals
+from strawberry_django_jwt2.refresh_token.utils import DJANGO_ASYNC_ORM, hash_token
 from strawberry_django_jwt2.settings import jwt_settings
 
 
@@ -20,7 +22,9 @@ class AbstractRefreshToken(models.Model):
         verbose_name=_("user"),
     )
     token = models.CharField(_("token"), max_length=255, editable=False)
-    created = models.DateTimeField(_("created"), auto_now_add=True)
+    # Fixed-width SHA-256 of the token, used for lookups instead of the token itself
+    token_hash = models.CharField(_("token hash"), max_length=64, editable=False, db_index=True, default="")
+    created = models.DateTimeField(_("created"), auto_now_add=True, db_index=True)
     revoked = models.DateTimeField(_("revoked"), null=True, blank=True)
 
     objects = managers.RefreshTokenQuerySet.as_manager()
@@ -30,6 +34,15 @@ class AbstractRefreshToken(models.Model):
         verbose_name = _("refresh token")
         verbose_name_plural = _("refresh tokens")
         unique_together = ("token", "revoked")
+        # Short suffixes keep the app-qualified names within 30 characters
+        indexes = [
+            models.Index(
+                fields=["token_hash"],
+                condition=models.Q(revoked__isnull=True),
+                name="%(app_label)s_%(class)s_ah",
+            ),
+            models.Index(fields=["user", "created"], name="%(app_label)s_%(class)s_uc"),
+        ]
 
     def __str__(self):
         return self.token
@@ -38,6 +51,12 @@ class AbstractRefreshToken(models.Model):
         if not self.token:
             self.token = self._cached_token = self.generate_token()
 
+        self.token_hash = hash_token(self.token)
+        update_fields = kwargs.get("update_fields")
+
+        if update_fields is not None and "token" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "token_hash"}
+
         super().save(*args, **kwargs)
 
     def generate_token(self):
@@ -69,6 +88,60 @@ class AbstractRefreshToken(models.Model):
         self.created = timezone.now()
         self.save(update_fields=["token", "created"])
 
+    def rotate(self, request=None):
+        """
+        Replace the token with a new one in a single conditional UPDATE.
+
+        Return False, leaving the instance untouched, when the stored token
+        was rotated or revoked since it was loaded.
+        """
+        token = self.generate_token()
+        created = timezone.now()
+        rotated = self._current().update(token=token, token_hash=hash_token(token), created=created)
+        return self._rotated(rotated, token, created)
+
+    async def arotate(self, request=None):
+        token = self.generate_token()
+        created = timezone.now()
+        fields = {"token": token, "token_hash": hash_token(token), "created": created}
+
+        if DJANGO_ASYNC_ORM:
+            rotated = await self._current().aupdate(**fields)
+        else:
+            rotated = await sync_to_async(self._current().update)(**fields)
+        return self._rotated(rotated, token, created)
+
+    def retire(self, request=None):
+        """
+        Revoke the token in a single conditional UPDATE once it was
+        exchanged for a new one.
+
+        Return False when it was rotated or revoked since it was loaded.
+        """
+        revoked = timezone.now()
+
+        if not self._current().update(revoked=revoked):
+            return False
+
+        self.revoked = revoked
+
+        signals.refresh_token_revoked.send(
+            sender=AbstractRefreshToken,
+            request=request,
+            refresh_token=self,
+        )
+        return True
+
+    def _current(self):
+        return type(self)._default_manager.filter(pk=self.pk, token_hash=hash_token(self.token), revoked__isnull=True)
+
+    def _rotated(self, rotated, token, created):
+        if rotated:
+            self.token = self._cached_token = token
+            self.token_hash = hash_token(token)
+            self.created = created
+        return bool(rotated)
+
 
 class RefreshToken(AbstractRefreshToken):
     """RefreshToken default model"""
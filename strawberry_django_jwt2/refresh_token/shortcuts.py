@@ -1,10 +1,19 @@
+from typing import List
+
 from asgiref.sync import sync_to_async
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
 from django.utils.functional import lazy
 from django.utils.translation import gettext as _
 
 from strawberry_django_jwt2.exceptions import JSONWebTokenError
 from strawberry_django_jwt2.refresh_token.models import AbstractRefreshToken
-from strawberry_django_jwt2.refresh_token.utils import get_refresh_token_model
+from strawberry_django_jwt2.refresh_token.utils import (
+    DJANGO_ASYNC_ORM,
+    aget_refresh_token_by_model,
+    get_refresh_token_by_model,
+    get_refresh_token_model,
+)
 from strawberry_django_jwt2.settings import jwt_settings
 
 
@@ -22,11 +31,91 @@ def get_refresh_token(token, context=None):
         raise JSONWebTokenError(_("Invalid refresh token"))
 
 
+def get_refresh_token_with_user(token, context=None):
+    refresh_token = get_refresh_token(token, context)
+    # Custom handlers may leave the user to a lazy query, not allowed in async code
+    refresh_token.user
+    return refresh_token
+
+
+async def aget_refresh_token(token, context=None):
+    refresh_token_model = get_refresh_token_model()
+
+    if jwt_settings.JWT_GET_REFRESH_TOKEN_HANDLER is not get_refresh_token_by_model:
+        return await sync_to_async(get_refresh_token_with_user)(token, context)
+
+    try:
+        return await aget_refresh_token_by_model(refresh_token_model, token, context)
+
+    except refresh_token_model.DoesNotExist:
+        raise JSONWebTokenError(_("Invalid refresh token"))
+
+
 def create_refresh_token(user, refresh_token=None) -> AbstractRefreshToken:
     if refresh_token is not None and jwt_settings.JWT_REUSE_REFRESH_TOKENS:
-        refresh_token.reuse()
+        # A concurrent refresh with the same token already rotated it
+        if not refresh_token.rotate():
+            raise JSONWebTokenError(_("Invalid refresh token"))
+        return refresh_token
+
+    max_tokens = get_max_refresh_tokens()
+    objects = get_refresh_token_model().objects
+
+    with transaction.atomic(using=objects.db):
+        # Revoke and issue together, only one concurrent refresh can retire the token
+        if refresh_token is not None and not refresh_token.retire():
+            raise JSONWebTokenError(_("Invalid refresh token"))
+
+        refresh_token = objects.create(user=user)
+
+    prune_refresh_tokens([user], max_tokens)
+    return refresh_token
+
+
+async def acreate_refresh_token(user, refresh_token=None) -> AbstractRefreshToken:
+    if refresh_token is not None and jwt_settings.JWT_REUSE_REFRESH_TOKENS:
+        if not await refresh_token.arotate():
+            raise JSONWebTokenError(_("Invalid refresh token"))
         return refresh_token
-    return get_refresh_token_model().objects.create(user=user)
+
+    if refresh_token is not None:
+        # Transactions are not available to async code
+        return await sync_to_async(create_refresh_token)(user, refresh_token)
+
+    max_tokens = get_max_refresh_tokens()
+    objects = get_refresh_token_model().objects
+
+    if DJANGO_ASYNC_ORM:
+        refresh_token = await objects.acreate(user=user)
+    else:
+        refresh_token = await sync_to_async(objects.create)(user=user)
+
+    if max_tokens is not None:
+        await sync_to_async(prune_refresh_tokens)([user], max_tokens)
+    return refresh_token
+
+
+def create_refresh_tokens(users) -> List[AbstractRefreshToken]:
+    users = list(users)
+    max_tokens = get_max_refresh_tokens()
+    objects = get_refresh_token_model().objects
+    refresh_tokens = objects.bulk_create(objects.build_many(users))
+    prune_refresh_tokens(users, max_tokens)
+    return refresh_tokens
+
+
+def get_max_refresh_tokens():
+    # Checked before issuing, a limit below 1 would delete the token being issued
+    max_tokens = jwt_settings.JWT_MAX_REFRESH_TOKENS_PER_USER
+
+    if max_tokens is not None and max_tokens < 1:
+        raise ImproperlyConfigured("JWT_MAX_REFRESH_TOKENS_PER_USER must be at least 1.")
+    return max_tokens
+
+
+def prune_refresh_tokens(users, max_tokens):
+    if max_tokens is not None:
+        get_refresh_token_model().objects.prune(users, max_tokens)
 
 
 refresh_token_lazy = lazy(
@@ -36,7 +125,7 @@ refresh_token_lazy = lazy(
 
 
 async def create_token_lazy_async(user, refresh_token=None):
-    res = await sync_to_async(create_refresh_token)(user, refresh_token)
+    res = await acreate_refresh_token(user, refresh_token)
     return res.get_token()
 
 
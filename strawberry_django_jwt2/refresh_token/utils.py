@@ -1,11 +1,28 @@
+from hashlib import sha256
+
+from asgiref.sync import sync_to_async
+import django
 from django.apps import apps
 
 from strawberry_django_jwt2.settings import jwt_settings
 
+# QuerySet.aget(), acreate() and aupdate() were added in Django 4.1
+DJANGO_ASYNC_ORM = django.VERSION >= (4, 1)
+
 
 def get_refresh_token_model():
     return apps.get_model(jwt_settings.JWT_REFRESH_TOKEN_MODEL)
 
 
+def hash_token(token):
+    return sha256(str(token).encode("utf8")).hexdigest()
+
+
 def get_refresh_token_by_model(refresh_token_model, token, context=None):
-    return refresh_token_model.objects.get(token=token, revoked__isnull=True)
+    return refresh_token_model.objects.select_related("user").get(token_hash=hash_token(token), token=token, revoked__isnull=True)
+
+
+async def aget_refresh_token_by_model(refresh_token_model, token, context=None):
+    if not DJANGO_ASYNC_ORM:
+        return await sync_to_async(get_refresh_token_by_model)(refresh_token_model, token, context)
+    return await refresh_token_model.objects.select_related("user").aget(token_hash=hash_token(token), token=token, revoked__isnull=True)
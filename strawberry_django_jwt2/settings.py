@@ -13,6 +13,10 @@ DEFAULTS = {
     "JWT_SECRET_KEY": settings.SECRET_KEY,
     "JWT_PUBLIC_KEY": None,
     "JWT_PRIVATE_KEY": None,
+    "JWT_KEY_ID": None,
+    "JWT_KEY_RING": {},
+    "JWT_JWKS_FILE": None,
+    "JWT_JWKS_REFRESH_INTERVAL": timedelta(seconds=60),
     "JWT_VERIFY": True,
     "JWT_VERIFY_EXPIRATION": False,
     "JWT_EXPIRATION_DELTA": timedelta(seconds=60 * 5),
@@ -22,6 +26,14 @@ DEFAULTS = {
     "JWT_REFRESH_TOKEN_MODEL": "refresh_token.RefreshToken",
     "JWT_REFRESH_TOKEN_N_BYTES": 20,
     "JWT_REUSE_REFRESH_TOKENS": False,
+    "JWT_MAX_REFRESH_TOKENS_PER_USER": None,
+    "JWT_PAYLOAD_CACHE": None,
+    "JWT_PAYLOAD_CACHE_SIZE": 0,
+    "JWT_PAYLOAD_CACHE_TIMEOUT": timedelta(seconds=60 * 5),
+    "JWT_CLAIMS_USER": False,
+    "JWT_EMBED_PERMISSIONS": False,
+    "JWT_USER_CACHE": None,
+    "JWT_USER_CACHE_TIMEOUT": timedelta(seconds=60),
     "JWT_AUTH_HEADER_NAME": "HTTP_AUTHORIZATION",
     "JWT_AUTH_HEADER_PREFIX": "JWT",
     "JWT_ALLOW_ARGUMENT": False,
@@ -37,6 +49,9 @@ DEFAULTS = {
     "JWT_ALLOW_ANY_HANDLER": "strawberry_django_jwt2.middleware.allow_any",
     "JWT_ALLOW_ANY_CLASSES": (),
     "JWT_AUTHENTICATE_INTROSPECTION": True,
+    "JWT_AUTHENTICATE_PER_OPERATION": False,
+    "JWT_MIDDLEWARE_DIRECT_AUTH": False,
+    "JWT_MIDDLEWARE_SKIP_LEAF_FIELDS": False,
     "JWT_CSRF_ROTATION": False,
     "JWT_HIDE_TOKEN_FIELDS": False,
     "JWT_COOKIE_NAME": "JWT",
@@ -1,5 +1,7 @@
+from strawberry_django_jwt2.claims import get_claims_user, set_token_perms
 from strawberry_django_jwt2.refresh_token.shortcuts import (
     create_refresh_token,
+    create_refresh_tokens,
     get_refresh_token,
 )
 from strawberry_django_jwt2.settings import jwt_settings
@@ -11,10 +13,12 @@ from strawberry_django_jwt2.utils import (
 
 __all__ = [
     "get_token",
+    "get_tokens",
     "get_user_by_token",
     "get_user_by_token_async",
     "get_refresh_token",
     "create_refresh_token",
+    "create_refresh_tokens",
 ]
 
 
@@ -25,11 +29,33 @@ def get_token(user, context=None, **extra):
     return jwt_settings.JWT_ENCODE_HANDLER(payload, context)
 
 
+def get_tokens(users, context=None, **extra):
+    return [get_token(user, context, **extra) for user in users]
+
+
 def get_user_by_token(token, context=None):
     payload = get_payload(token, context)
-    return get_user_by_payload(payload)
+
+    if jwt_settings.JWT_CLAIMS_USER:
+        user = get_claims_user(payload)
+
+        if user is not None:
+            return user
+    return with_token_perms(get_user_by_payload(payload), payload)
 
 
 async def get_user_by_token_async(token, context=None):
     payload = get_payload(token, context)
-    return await get_user_by_payload_async(payload)
+
+    if jwt_settings.JWT_CLAIMS_USER:
+        user = get_claims_user(payload)
+
+        if user is not None:
+            return user
+    return with_token_perms(await get_user_by_payload_async(payload), payload)
+
+
+def with_token_perms(user, payload):
+    if user is None:
+        return None
+    return set_token_perms(user, payload)
@@ -1,27 +1,37 @@
 from __future__ import annotations
 
-import asyncio
 from calendar import timegm
 from contextlib import suppress
 from datetime import datetime
 from inspect import isawaitable
-from typing import TYPE_CHECKING, Any, Optional, cast
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional, cast
 
 from asgiref.sync import sync_to_async
 from django.contrib.auth import get_user_model
+from django.contrib.auth.base_user import BaseUserManager
 from django.contrib.auth.models import User
 from django.http import HttpRequest
 from django.utils.translation import gettext as _
 from graphql import GraphQLResolveInfo
 import jwt
-from packaging.version import parse as parse_ver
 from strawberry.annotation import StrawberryAnnotation  # type: ignore
 from strawberry.django.context import StrawberryDjangoContext
 from strawberry.types import Info
 from strawberry_django.arguments import StrawberryArgument
 
 from strawberry_django_jwt2 import exceptions, object_types, signals
-from strawberry_django_jwt2.refresh_token.shortcuts import create_refresh_token
+from strawberry_django_jwt2.cache import (
+    cache_payload,
+    cache_user,
+    get_cached_payload,
+    get_cached_user,
+)
+from strawberry_django_jwt2.codec import get_token_codec
+from strawberry_django_jwt2.refresh_token.shortcuts import (
+    acreate_refresh_token,
+    create_refresh_tokens,
+)
+from strawberry_django_jwt2.refresh_token.utils import DJANGO_ASYNC_ORM
 from strawberry_django_jwt2.settings import jwt_settings
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -67,36 +77,41 @@ def jwt_payload(user, _=None):
     if jwt_settings.JWT_ISSUER is not None:
         payload["iss"] = jwt_settings.JWT_ISSUER
 
+    if jwt_settings.JWT_CLAIMS_USER:
+        payload["userId"] = str(user.pk)
+        payload["isStaff"] = getattr(user, "is_staff", False)
+        payload["isSuperuser"] = getattr(user, "is_superuser", False)
+
+    if jwt_settings.JWT_EMBED_PERMISSIONS:
+        payload["perms"] = get_user_perms_claim(user)
+
     return object_types.TokenPayloadType(**payload)
 
 
+def get_user_perms_claim(user):
+    # claims imports this module, ALL_PERMS can only be resolved at call time
+    from strawberry_django_jwt2.claims import ALL_PERMS
+
+    # Superusers hold every permission, a wildcard keeps their tokens small
+    if user.is_active and getattr(user, "is_superuser", False):
+        return [ALL_PERMS]
+    return sorted(user.get_all_permissions())
+
+
+async def create_payload_async(user, context=None):
+    """Call `JWT_PAYLOAD_HANDLER` from async code."""
+    if jwt_settings.JWT_EMBED_PERMISSIONS:
+        # The perms claim queries the permissions of the user
+        return await sync_to_async(jwt_settings.JWT_PAYLOAD_HANDLER)(user, context)
+    return jwt_settings.JWT_PAYLOAD_HANDLER(user, context)
+
+
 def jwt_encode(payload: object_types.TokenPayloadType, _=None) -> str:
-    token = jwt.encode(
-        payload.__dict__,
-        jwt_settings.JWT_PRIVATE_KEY or jwt_settings.JWT_SECRET_KEY,
-        jwt_settings.JWT_ALGORITHM,
-    )
-    if parse_ver(jwt.__version__) < parse_ver("2.0.0"):  # type: ignore
-        return cast(bytes, token).decode("utf8")
-    return cast(str, token)
+    return cast(str, get_token_codec().encode(payload.__dict__))
 
 
 def jwt_decode(token: str, _=None) -> object_types.TokenPayloadType:
-    return object_types.TokenPayloadType(
-        **jwt.decode(
-            token,
-            jwt_settings.JWT_PUBLIC_KEY or jwt_settings.JWT_SECRET_KEY,
-            options={
-                "verify_exp": jwt_settings.JWT_VERIFY_EXPIRATION,
-                "verify_aud": jwt_settings.JWT_AUDIENCE is not None,
-                "verify_signature": jwt_settings.JWT_VERIFY,
-            },
-            leeway=jwt_settings.JWT_LEEWAY,
-            audience=jwt_settings.JWT_AUDIENCE,
-            issuer=jwt_settings.JWT_ISSUER,
-            algorithms=[jwt_settings.JWT_ALGORITHM],
-        )
-    )
+    return object_types.TokenPayloadType(**get_token_codec().decode(token))
 
 
 def get_http_authorization(context):
@@ -137,8 +152,13 @@ def get_credentials(request, **kwargs):
 
 
 def get_payload(token, context=None):
+    payload = get_cached_payload(token)
+
+    if payload is not None:
+        return payload
+
     try:
-        return jwt_settings.JWT_DECODE_HANDLER(token, context)
+        payload = jwt_settings.JWT_DECODE_HANDLER(token, context)
     except jwt.ExpiredSignatureError:
         raise exceptions.JSONWebTokenExpired()
     except jwt.DecodeError:
@@ -146,22 +166,48 @@ def get_payload(token, context=None):
     except jwt.InvalidTokenError:
         raise exceptions.JSONWebTokenError(_("Invalid token"))
 
+    cache_payload(token, payload)
+    return payload
+
 
 def get_user_by_natural_key(username):
+    user = get_cached_user(username)
+
+    if user is not None:
+        return user
+
     user_model = get_user_model()
     try:
-        return user_model.objects.get_by_natural_key(username)
+        user = user_model.objects.get_by_natural_key(username)
     except user_model.DoesNotExist:
         return None
 
+    cache_user(username, user)
+    return user
+
+
+async def aget_by_natural_key(manager, username):
+    # Managers with their own natural key lookup keep it, through the sync executor
+    if not DJANGO_ASYNC_ORM or type(manager).get_by_natural_key is not BaseUserManager.get_by_natural_key:
+        return await sync_to_async(manager.get_by_natural_key)(username)
+    return await manager.aget(**{manager.model.USERNAME_FIELD: username})
+
 
 async def get_user_by_natural_key_async(username):
+    user = get_cached_user(username)
+
+    if user is not None:
+        return user
+
     user_model = get_user_model()
     try:
-        return await sync_to_async(user_model.objects.get_by_natural_key)(username)
+        user = await aget_by_natural_key(user_model.objects, username)
     except user_model.DoesNotExist:
         return None
 
+    cache_user(username, user)
+    return user
+
 
 def get_user_by_payload(payload):
     username = jwt_settings.JWT_PAYLOAD_GET_USERNAME_HANDLER(payload)
@@ -244,14 +290,12 @@ def get_context(info: HttpRequest | Request | Info[Any, Any] | GraphQLResolveInf
 
 
 async def create_user_token(user: User) -> object_types.TokenDataType:
-    token: object_types.TokenPayloadType = jwt_settings.JWT_PAYLOAD_HANDLER(user)
+    token: object_types.TokenPayloadType = await create_payload_async(user)
     token_object = object_types.TokenDataType(payload=token, token=jwt_settings.JWT_ENCODE_HANDLER(token))
     if jwt_settings.JWT_ALLOW_REFRESH:
         token_object.refresh_expires_in = token.exp - int(datetime.now().timestamp())
     if jwt_settings.JWT_LONG_RUNNING_REFRESH_TOKEN:
-        refresh_token = (  # type: ignore
-            (await sync_to_async(create_refresh_token)(user)) if asyncio.get_event_loop().is_running() else create_refresh_token(user)
-        )
+        refresh_token = await acreate_refresh_token(user)
         token_object.refresh_expires_in = (
             refresh_token.created.timestamp() + jwt_settings.JWT_REFRESH_EXPIRATION_DELTA.total_seconds() - int(datetime.now().timestamp())
         )
@@ -259,3 +303,29 @@ async def create_user_token(user: User) -> object_types.TokenDataType:
 
     signals.token_issued.send(sender=create_user_token, request=None, user=user)
     return token_object
+
+
+async def create_user_tokens(users: Iterable[User]) -> List[object_types.TokenDataType]:
+    users = list(users)
+    now = int(datetime.now().timestamp())
+    token_objects = []
+
+    for user in users:
+        token: object_types.TokenPayloadType = await create_payload_async(user)
+        token_object = object_types.TokenDataType(payload=token, token=jwt_settings.JWT_ENCODE_HANDLER(token))
+        if jwt_settings.JWT_ALLOW_REFRESH:
+            token_object.refresh_expires_in = token.exp - now
+        token_objects.append(token_object)
+
+    if jwt_settings.JWT_LONG_RUNNING_REFRESH_TOKEN:
+        # A single INSERT for all the refresh tokens
+        refresh_tokens = await sync_to_async(create_refresh_tokens)(users)
+        refresh_expiration_delta = jwt_settings.JWT_REFRESH_EXPIRATION_DELTA.total_seconds()
+
+        for token_object, refresh_token in zip(token_objects, refresh_tokens):
+            token_object.refresh_expires_in = refresh_token.created.timestamp() + refresh_expiration_delta - now
+            token_object.refresh_token = refresh_token.get_token()
+
+    for user in users:
+        signals.token_issued.send(sender=create_user_tokens, request=None, user=user)
+    return token_objects
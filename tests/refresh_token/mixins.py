@@ -235,6 +235,31 @@ class AsyncRefreshMixin(RefreshTokenMixin):
         self.assertEqual(refresh_token.user_id, self.user.id)
         self.assertGreater(refresh_token.created, self.refresh_token.created)
 
+    @OverrideJwtSettings(JWT_LONG_RUNNING_REFRESH_TOKEN=True, JWT_EMBED_PERMISSIONS=True)
+    async def test_refresh_token_embed_permissions(self):
+        reload(strawberry_django_jwt2.object_types)
+        self.addCleanup(reload, strawberry_django_jwt2.object_types)
+        reload(strawberry_django_jwt2.mixins)
+        reload(strawberry_django_jwt2.mutations)
+        self.refresh_token_mutations = {
+            "refresh_token": strawberry_django_jwt2.mutations.RefreshAsync.refresh,
+        }
+        m = type(
+            "jwt",
+            (object,),
+            {**{name: mutation for name, mutation in self.refresh_token_mutations.items()}},
+        )
+        self.Mutation = strawberry.type(m)
+        self.client.schema(query=self.Query, mutation=self.Mutation)
+        response = await self.execute(
+            {
+                "refreshToken": self.refresh_token.token,
+            }
+        )
+
+        self.assertIsNone(response.errors)
+        self.assertUsernameIn(response.data["refreshToken"]["payload"])
+
     @OverrideJwtSettings(JWT_LONG_RUNNING_REFRESH_TOKEN=True, JWT_REUSE_REFRESH_TOKENS=True)
     async def test_reuse_refresh_token(self):
         reload(strawberry_django_jwt2.mixins)
@@ -1,7 +1,10 @@
 import io
+from unittest import mock
 
-from django.core.management import call_command
+from django.core.management import CommandError, call_command
+from django.db.models.signals import post_delete
 
+from strawberry_django_jwt2.refresh_token.utils import get_refresh_token_model
 from strawberry_django_jwt2.shortcuts import create_refresh_token
 from tests.testcases import UserTestCase
 
@@ -22,3 +25,58 @@ class ClearTokensTests(UserTestCase):
         call_command("cleartokens", expired=True, stdout=self.f)
 
         self.assertIn("deleted 0 tokens", self.f.getvalue())
+
+    def test_clear_in_batches(self):
+        self.refresh_token.revoke()
+        for _ in range(4):
+            create_refresh_token(self.user).revoke()
+
+        call_command("cleartokens", batch_size=2, stdout=self.f)
+
+        self.assertIn("deleted 5 tokens", self.f.getvalue())
+        self.assertFalse(get_refresh_token_model().objects.exists())
+
+    def test_max_runtime(self):
+        self.refresh_token.revoke()
+        create_refresh_token(self.user).revoke()
+
+        call_command("cleartokens", batch_size=1, max_runtime=0, stdout=self.f)
+
+        self.assertIn("deleted 1 token", self.f.getvalue())
+        self.assertIn("max-runtime", self.f.getvalue())
+        self.assertEqual(get_refresh_token_model().objects.count(), 1)
+
+    def test_dry_run(self):
+        self.refresh_token.revoke()
+        call_command("cleartokens", dry_run=True, stdout=self.f)
+
+        self.assertIn("Would delete 1 token", self.f.getvalue())
+        self.assertTrue(get_refresh_token_model().objects.exists())
+
+    def test_fast_delete(self):
+        self.refresh_token.revoke()
+
+        with mock.patch("django.db.models.QuerySet.delete") as delete_mock:
+            call_command("cleartokens", stdout=self.f)
+
+        delete_mock.assert_not_called()
+        self.assertIn("deleted 1 token", self.f.getvalue())
+
+    def test_signal_receivers(self):
+        self.refresh_token.revoke()
+        handler = mock.Mock()
+        post_delete.connect(handler, sender=get_refresh_token_model())
+        self.addCleanup(post_delete.disconnect, handler, sender=get_refresh_token_model())
+
+        call_command("cleartokens", stdout=self.f)
+
+        handler.assert_called_once()
+
+    def test_invalid_options(self):
+        self.refresh_token.revoke()
+
+        for options in ({"batch_size": 0}, {"batch_size": -1}, {"sleep": -1}, {"max_runtime": -1}):
+            with self.subTest(**options), self.assertRaises(CommandError):
+                call_command("cleartokens", stdout=self.f, **options)
+
+        self.assertTrue(get_refresh_token_model().objects.exists())
@@ -0,0 +1,72 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from strawberry_django_jwt2.refresh_token.utils import get_refresh_token_model
+from strawberry_django_jwt2.settings import jwt_settings
+from tests.testcases import UserTestCase
+
+
+class RefreshTokenQuerySetTests(UserTestCase):
+    def setUp(self):
+        super().setUp()
+        self.other_user = get_user_model().objects.create_user("other")
+        self.objects = get_refresh_token_model().objects
+
+    def test_build_many(self):
+        refresh_tokens = self.objects.build_many([self.user, self.other_user])
+        n_bytes = jwt_settings.JWT_REFRESH_TOKEN_N_BYTES
+
+        self.assertEqual([refresh_token.user for refresh_token in refresh_tokens], [self.user, self.other_user])
+        self.assertEqual([len(refresh_token.get_token()) for refresh_token in refresh_tokens], [n_bytes * 2] * 2)
+        self.assertNotEqual(refresh_tokens[0].token, refresh_tokens[1].token)
+        self.assertIsNone(refresh_tokens[0].pk)
+
+    def test_issue_many(self):
+        with self.assertNumQueries(1):
+            tokens = self.objects.issue_many([self.user, self.other_user, self.user])
+
+        self.assertEqual(set(tokens), {self.user, self.other_user})
+        self.assertEqual(self.objects.get(token=tokens[self.other_user]).user, self.other_user)
+
+    def test_expired_only(self):
+        refresh_token = self.objects.create(user=self.user)
+        self.objects.filter(pk=refresh_token.pk).update(created=timezone.now() - jwt_settings.JWT_REFRESH_EXPIRATION_DELTA - timedelta(seconds=1))
+        active_token = self.objects.create(user=self.other_user)
+
+        self.assertEqual(list(self.objects.expired_only()), [refresh_token])
+        self.assertEqual(list(self.objects.active_only()), [active_token])
+        self.assertNotIn("CASE", str(self.objects.expired_only().query))
+
+    def test_prune(self):
+        refresh_tokens = [self.objects.create(user=self.user) for _ in range(3)]
+        other_token = self.objects.create(user=self.other_user)
+
+        with self.assertNumQueries(2):
+            self.objects.prune([self.user], 2)
+
+        self.assertEqual(set(self.objects.all()), {*refresh_tokens[1:], other_token})
+
+    def test_prune_many(self):
+        refresh_tokens = [self.objects.create(user=self.user) for _ in range(3)]
+        other_tokens = [self.objects.create(user=self.other_user) for _ in range(2)]
+
+        with self.assertNumQueries(2):
+            self.objects.prune([self.user, self.other_user], 1)
+
+        self.assertEqual(set(self.objects.all()), {refresh_tokens[-1], other_tokens[-1]})
+
+    def test_prune_nothing(self):
+        self.objects.create(user=self.user)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(self.objects.prune([self.user], 2), (0, {}))
+
+    def test_prune_keep_nothing(self):
+        self.objects.create(user=self.user)
+
+        with self.assertRaises(ValueError):
+            self.objects.prune([self.user], 0)
+
+        self.assertTrue(self.objects.filter(user=self.user).exists())
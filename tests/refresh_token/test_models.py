@@ -1,11 +1,14 @@
 from time import sleep
 
+from django.test import SimpleTestCase
+from django.test.utils import isolate_apps
+
 from strawberry_django_jwt2.refresh_token.models import AbstractRefreshToken
 from strawberry_django_jwt2.refresh_token.signals import refresh_token_revoked
 from strawberry_django_jwt2.settings import jwt_settings
 from strawberry_django_jwt2.shortcuts import create_refresh_token
 from tests.context_managers import catch_signal, refresh_expired
-from tests.testcases import UserTestCase
+from tests.testcases import AsyncUserTestCase, UserTestCase
 
 
 class AbstractRefreshTokenTests(UserTestCase):
@@ -62,3 +65,41 @@ class AbstractRefreshTokenTests(UserTestCase):
 
         self.assertNotEqual(self.refresh_token.token, token)
         self.assertGreater(self.refresh_token.created, created)
+
+    def test_rotate(self):
+        token = self.refresh_token.get_token()
+
+        with self.assertNumQueries(1):
+            self.assertTrue(self.refresh_token.rotate())
+
+        self.assertNotEqual(self.refresh_token.get_token(), token)
+
+    def test_rotate_stale(self):
+        stale = type(self.refresh_token).objects.get(pk=self.refresh_token.pk)
+        self.refresh_token.rotate()
+
+        self.assertFalse(stale.rotate())
+        self.assertEqual(type(self.refresh_token).objects.get().token, self.refresh_token.token)
+
+
+class AbstractRefreshTokenTestsAsync(AsyncUserTestCase):
+    def setUp(self):
+        super().setUp()
+        self.refresh_token = create_refresh_token(self.user)
+
+    async def test_arotate(self):
+        stale = await type(self.refresh_token).objects.aget(pk=self.refresh_token.pk)
+
+        self.assertTrue(await self.refresh_token.arotate())
+        self.assertFalse(await stale.arotate())
+
+
+class AbstractRefreshTokenMetaTests(SimpleTestCase):
+    @isolate_apps("tests")
+    def test_index_names(self):
+        class CustomRefreshToken(AbstractRefreshToken):
+            class Meta(AbstractRefreshToken.Meta):
+                app_label = "tests"
+
+        self.assertEqual([index.name for index in CustomRefreshToken._meta.indexes], ["tests_customrefreshtoken_ah", "tests_customrefreshtoken_uc"])
+        self.assertFalse([error for error in CustomRefreshToken.check() if error.id == "models.E034"])
@@ -1,6 +1,18 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ImproperlyConfigured
+
 from strawberry_django_jwt2 import shortcuts
 from strawberry_django_jwt2.exceptions import JSONWebTokenError
-from tests.testcases import UserTestCase
+from strawberry_django_jwt2.refresh_token.shortcuts import (
+    acreate_refresh_token,
+    aget_refresh_token,
+)
+from strawberry_django_jwt2.refresh_token.signals import refresh_token_revoked
+from tests.context_managers import catch_signal
+from tests.decorators import OverrideJwtSettings
+from tests.testcases import AsyncUserTestCase, UserTestCase
 
 
 class ShortcutsTests(UserTestCase):
@@ -13,3 +25,100 @@ class ShortcutsTests(UserTestCase):
     def test_get_refresh_token_error(self):
         with self.assertRaises(JSONWebTokenError):
             shortcuts.get_refresh_token("invalid")
+
+    def test_create_refresh_tokens(self):
+        other_user = get_user_model().objects.create_user("other")
+
+        with self.assertNumQueries(1):
+            refresh_tokens = shortcuts.create_refresh_tokens([self.user, other_user])
+
+        self.assertEqual(len({refresh_token.get_token() for refresh_token in refresh_tokens}), 2)
+        self.assertEqual(shortcuts.get_refresh_token(refresh_tokens[1].get_token()).user, other_user)
+
+    @OverrideJwtSettings(JWT_MAX_REFRESH_TOKENS_PER_USER=2)
+    def test_max_refresh_tokens_per_user(self):
+        refresh_tokens = [shortcuts.create_refresh_token(self.user) for _ in range(3)]
+        shortcuts.create_refresh_tokens([self.user])
+
+        self.assertEqual(self.user.refresh_tokens.count(), 2)
+        self.assertIn(refresh_tokens[2], self.user.refresh_tokens.all())
+
+    @OverrideJwtSettings(JWT_MAX_REFRESH_TOKENS_PER_USER=0)
+    def test_max_refresh_tokens_per_user_invalid(self):
+        with self.assertRaises(ImproperlyConfigured):
+            shortcuts.create_refresh_token(self.user)
+
+        with self.assertRaises(ImproperlyConfigured):
+            shortcuts.create_refresh_tokens([self.user])
+
+        self.assertFalse(self.user.refresh_tokens.exists())
+
+    @OverrideJwtSettings(JWT_REUSE_REFRESH_TOKENS=True)
+    def test_create_refresh_token_concurrent_reuse(self):
+        refresh_token = shortcuts.create_refresh_token(self.user)
+        stale = shortcuts.get_refresh_token(refresh_token.get_token())
+        shortcuts.create_refresh_token(self.user, refresh_token)
+
+        with self.assertRaises(JSONWebTokenError):
+            shortcuts.create_refresh_token(self.user, stale)
+
+    def test_create_refresh_token_revokes_previous(self):
+        refresh_token = shortcuts.create_refresh_token(self.user)
+        stale = shortcuts.get_refresh_token(refresh_token.get_token())
+
+        with catch_signal(refresh_token_revoked) as refresh_token_revoked_handler:
+            new_refresh_token = shortcuts.create_refresh_token(self.user, refresh_token)
+
+        self.assertIsNotNone(refresh_token.revoked)
+        self.assertEqual(refresh_token_revoked_handler.call_count, 1)
+        self.assertEqual(refresh_token_revoked_handler.call_args[1]["refresh_token"], refresh_token)
+        self.assertNotEqual(new_refresh_token.pk, refresh_token.pk)
+
+        with self.assertRaises(JSONWebTokenError):
+            shortcuts.get_refresh_token(refresh_token.get_token())
+
+        with self.assertRaises(JSONWebTokenError):
+            shortcuts.create_refresh_token(self.user, stale)
+
+        self.assertEqual(self.user.refresh_tokens.count(), 2)
+
+
+class ShortcutsTestsAsync(AsyncUserTestCase):
+    async def test_aget_refresh_token(self):
+        refresh_token = await acreate_refresh_token(self.user)
+        refresh_token = await aget_refresh_token(refresh_token.get_token())
+
+        self.assertEqual(refresh_token.user, self.user)
+
+    async def test_aget_refresh_token_error(self):
+        with self.assertRaises(JSONWebTokenError):
+            await aget_refresh_token("invalid")
+
+    @OverrideJwtSettings(JWT_REUSE_REFRESH_TOKENS=True)
+    async def test_acreate_refresh_token_reuse(self):
+        refresh_token = await acreate_refresh_token(self.user)
+        token = refresh_token.get_token()
+        reused = await acreate_refresh_token(self.user, refresh_token)
+
+        self.assertIs(reused, refresh_token)
+        self.assertNotEqual(reused.get_token(), token)
+
+    async def test_acreate_refresh_token_revokes_previous(self):
+        refresh_token = await acreate_refresh_token(self.user)
+        await acreate_refresh_token(self.user, refresh_token)
+
+        with self.assertRaises(JSONWebTokenError):
+            await acreate_refresh_token(self.user, await type(refresh_token).objects.aget(pk=refresh_token.pk))
+
+    @OverrideJwtSettings(JWT_REUSE_REFRESH_TOKENS=True)
+    async def test_sync_orm_fallback(self):
+        with mock.patch("strawberry_django_jwt2.refresh_token.shortcuts.DJANGO_ASYNC_ORM", False), mock.patch(
+            "strawberry_django_jwt2.refresh_token.models.DJANGO_ASYNC_ORM", False
+        ), mock.patch("strawberry_django_jwt2.refresh_token.utils.DJANGO_ASYNC_ORM", False):
+            refresh_token = await acreate_refresh_token(self.user)
+            token = refresh_token.get_token()
+            reused = await acreate_refresh_token(self.user, refresh_token)
+
+            self.assertEqual((await aget_refresh_token(reused.get_token())).pk, refresh_token.pk)
+
+        self.assertNotEqual(reused.get_token(), token)
@@ -0,0 +1,32 @@
+from strawberry_django_jwt2.refresh_token.utils import (
+    get_refresh_token_by_model,
+    get_refresh_token_model,
+    hash_token,
+)
+from strawberry_django_jwt2.shortcuts import create_refresh_token
+from tests.testcases import UserTestCase
+
+
+class GetRefreshTokenByModelTests(UserTestCase):
+    def setUp(self):
+        super().setUp()
+        self.refresh_token = create_refresh_token(self.user)
+
+    def test_token_hash(self):
+        self.assertEqual(self.refresh_token.token_hash, hash_token(self.refresh_token.get_token()))
+
+    def test_get_by_hash(self):
+        refresh_token = get_refresh_token_by_model(get_refresh_token_model(), self.refresh_token.get_token())
+        self.assertEqual(refresh_token, self.refresh_token)
+
+    def test_reuse_updates_hash(self):
+        self.refresh_token.reuse()
+        self.refresh_token.refresh_from_db()
+
+        self.assertEqual(self.refresh_token.token_hash, hash_token(self.refresh_token.token))
+
+    def test_revoked(self):
+        self.refresh_token.revoke()
+
+        with self.assertRaises(get_refresh_token_model().DoesNotExist):
+            get_refresh_token_by_model(get_refresh_token_model(), self.refresh_token.get_token())
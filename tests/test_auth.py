@@ -9,8 +9,9 @@ else:
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.exceptions import PermissionDenied
-from django.test import RequestFactory
+from django.test import RequestFactory, override_settings
 
+from strawberry_django_jwt2 import auth
 from strawberry_django_jwt2.auth import authenticate
 from strawberry_django_jwt2.backends import JSONWebTokenBackend
 from tests.testcases import AsyncTestCase
@@ -100,3 +101,17 @@ class AsyncAuthTests(AsyncTestCase):
             result = await authenticate(request)
 
         self.assertEqual(result, self.user)
+
+    async def test_backends_cached(self):
+        settings.AUTHENTICATION_BACKENDS = ["tests.test_auth.SyncDefaultAuth"]
+        request = self.request_factory.post("/")
+
+        with patch("strawberry_django_jwt2.auth.load_backend", wraps=auth.load_backend) as load_backend:
+            await authenticate(request)
+            await authenticate(request)
+
+            with override_settings(AUTHENTICATION_BACKENDS=["tests.test_auth.AsyncDefaultAuth"]):
+                await authenticate(request)
+                self.assertTrue(auth.get_backends()[0].is_coroutine)
+
+        self.assertEqual(load_backend.call_count, 2)
@@ -0,0 +1,201 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+
+from strawberry_django_jwt2 import exceptions, utils
+from strawberry_django_jwt2.cache import payload_cache, shared_payload_cache
+from tests.decorators import OverrideJwtSettings
+from tests.testcases import AsyncTestCase, TestCase
+
+
+class PayloadCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.other_user = get_user_model().objects.create_user("other")
+        payload_cache.clear()
+
+    def test_hit(self):
+        decode_mock = mock.Mock(wraps=utils.jwt_decode)
+
+        with OverrideJwtSettings(JWT_PAYLOAD_CACHE_SIZE=10, JWT_DECODE_HANDLER=decode_mock):
+            first = utils.get_payload(self.token)
+            second = utils.get_payload(self.token)
+
+            self.assertEqual(payload_cache.hits, 1)
+            self.assertEqual(payload_cache.misses, 1)
+
+        decode_mock.assert_called_once()
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
+    def test_disabled(self):
+        utils.get_payload(self.token)
+        utils.get_payload(self.token)
+
+        self.assertEqual(len(payload_cache), 0)
+        self.assertEqual(payload_cache.misses, 0)
+
+    @OverrideJwtSettings(JWT_PAYLOAD_CACHE_SIZE=1)
+    def test_evict_least_recently_used(self):
+        other_token = utils.jwt_encode(utils.jwt_payload(self.other_user))
+        utils.get_payload(self.token)
+        utils.get_payload(other_token)
+
+        self.assertEqual(len(payload_cache), 1)
+        self.assertIsNone(payload_cache.get(self.token))
+
+    @OverrideJwtSettings(JWT_PAYLOAD_CACHE_SIZE=10)
+    def test_expires_with_token(self):
+        utils.get_payload(self.token)
+
+        with mock.patch("strawberry_django_jwt2.cache.time.time", return_value=self.payload.exp + 1):
+            self.assertIsNone(payload_cache.get(self.token))
+
+        self.assertEqual(len(payload_cache), 0)
+
+    @OverrideJwtSettings(JWT_PAYLOAD_CACHE_SIZE=10, JWT_VERIFY_EXPIRATION=True, JWT_EXPIRATION_DELTA=timedelta(seconds=-1))
+    def test_expired_token_not_cached(self):
+        token = utils.jwt_encode(utils.jwt_payload(self.user))
+
+        with self.assertRaises(exceptions.JSONWebTokenExpired):
+            utils.get_payload(token)
+
+        self.assertEqual(len(payload_cache), 0)
+
+    @OverrideJwtSettings(JWT_PAYLOAD_CACHE_SIZE=10)
+    def test_clear_on_settings_change(self):
+        utils.get_payload(self.token)
+
+        with OverrideJwtSettings(JWT_PAYLOAD_CACHE_SIZE=10, JWT_SECRET_KEY="other"):
+            self.assertEqual(len(payload_cache), 0)
+
+            with self.assertRaises(exceptions.JSONWebTokenError):
+                utils.get_payload(self.token)
+
+
+class SharedPayloadCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        caches["default"].clear()
+
+    def test_hit(self):
+        decode_mock = mock.Mock(wraps=utils.jwt_decode)
+
+        with OverrideJwtSettings(JWT_PAYLOAD_CACHE="default", JWT_DECODE_HANDLER=decode_mock):
+            first = utils.get_payload(self.token)
+            second = utils.get_payload(self.token)
+
+            self.assertEqual(shared_payload_cache.hits, 1)
+            self.assertEqual(shared_payload_cache.misses, 1)
+
+        decode_mock.assert_called_once()
+        self.assertEqual(first, second)
+
+    @OverrideJwtSettings(JWT_PAYLOAD_CACHE="default")
+    def test_timeout_clamped_to_exp(self):
+        with mock.patch.object(caches["default"], "set") as set_mock, mock.patch(
+            "strawberry_django_jwt2.cache.time.time",
+            return_value=self.payload.exp - 10,
+        ):
+            utils.get_payload(self.token)
+
+        self.assertEqual(set_mock.call_args[0][2], 10)
+
+    @OverrideJwtSettings(JWT_PAYLOAD_CACHE="default", JWT_PAYLOAD_CACHE_SIZE=10)
+    def test_fill_local_cache(self):
+        utils.get_payload(self.token)
+        payload_cache.clear()
+
+        utils.get_payload(self.token)
+
+        self.assertEqual(shared_payload_cache.hits, 1)
+        self.assertEqual(len(payload_cache), 1)
+
+    @OverrideJwtSettings(JWT_PAYLOAD_CACHE="default", JWT_PAYLOAD_CACHE_SIZE=10)
+    def test_key_rotation(self):
+        utils.get_payload(self.token)
+
+        with OverrideJwtSettings(JWT_PAYLOAD_CACHE="default", JWT_PAYLOAD_CACHE_SIZE=10, JWT_SECRET_KEY="rotated"):
+            with self.assertRaises(exceptions.JSONWebTokenError):
+                utils.get_payload(self.token)
+
+    @OverrideJwtSettings(JWT_PAYLOAD_CACHE="default")
+    def test_payload_fields_changed(self):
+        shared_payload_cache.set(self.token, self.payload)
+        key = shared_payload_cache.key(self.token, type(self.payload))
+        caches["default"].set(key, {"unknown": True})
+
+        self.assertIsNone(shared_payload_cache.get(self.token, type(self.payload)))
+        self.assertEqual(shared_payload_cache.misses, 1)
+
+    @OverrideJwtSettings(JWT_PAYLOAD_CACHE="default", JWT_DECODE_HANDLER=lambda token, context=None: {"username": "test"})
+    def test_custom_decode_handler(self):
+        self.assertEqual(utils.get_payload(self.token), {"username": "test"})
+
+
+class UserCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        caches["default"].clear()
+
+    @OverrideJwtSettings(JWT_USER_CACHE="default")
+    def test_hit(self):
+        utils.get_user_by_natural_key(self.user.username)
+
+        with self.assertNumQueries(0):
+            user = utils.get_user_by_natural_key(self.user.username)
+
+        self.assertEqual(user, self.user)
+
+    def test_disabled(self):
+        utils.get_user_by_natural_key(self.user.username)
+
+        with self.assertNumQueries(1):
+            utils.get_user_by_natural_key(self.user.username)
+
+    @OverrideJwtSettings(JWT_USER_CACHE="default")
+    def test_invalidate_on_save(self):
+        utils.get_user_by_natural_key(self.user.username)
+
+        self.user.is_active = False
+        self.user.save()
+
+        with self.assertRaises(exceptions.JSONWebTokenError):
+            utils.get_user_by_payload(self.payload)
+
+    @OverrideJwtSettings(JWT_USER_CACHE="default")
+    def test_invalidate_on_rename(self):
+        username = self.user.username
+        utils.get_user_by_natural_key(username)
+
+        self.user.username = "renamed"
+        self.user.save()
+
+        self.assertIsNone(utils.get_user_by_natural_key(username))
+
+    @OverrideJwtSettings(JWT_USER_CACHE="default")
+    def test_invalidate_on_delete(self):
+        username = self.user.username
+        utils.get_user_by_natural_key(username)
+
+        self.user.delete()
+
+        self.assertIsNone(utils.get_user_by_natural_key(username))
+
+
+class UserCacheTestsAsync(AsyncTestCase):
+    def setUp(self):
+        super().setUp()
+        caches["default"].clear()
+
+    @OverrideJwtSettings(JWT_USER_CACHE="default")
+    async def test_hit_async(self):
+        await utils.get_user_by_natural_key_async(self.user.username)
+
+        with mock.patch("strawberry_django_jwt2.utils.sync_to_async") as sync_to_async_mock:
+            user = await utils.get_user_by_natural_key_async(self.user.username)
+
+        sync_to_async_mock.assert_not_called()
+        self.assertEqual(user, self.user)
@@ -0,0 +1,92 @@
+from importlib import reload
+
+from strawberry_django_jwt2 import exceptions, object_types, utils
+from strawberry_django_jwt2.claims import ClaimsUser
+from strawberry_django_jwt2.shortcuts import get_user_by_token, get_user_by_token_async
+from tests.decorators import OverrideJwtSettings
+from tests.testcases import AsyncTestCase, TestCase
+
+
+class ClaimsUserTests(TestCase):
+    @OverrideJwtSettings(JWT_CLAIMS_USER=True)
+    def setUp(self):
+        reload(object_types)
+        self.addCleanup(reload, object_types)
+        super().setUp()
+
+    @OverrideJwtSettings(JWT_CLAIMS_USER=True)
+    def test_payload_claims(self):
+        payload = utils.jwt_payload(self.user)
+
+        self.assertEqual(payload.userId, str(self.user.pk))
+        self.assertFalse(payload.isStaff)
+        self.assertFalse(payload.isSuperuser)
+
+    @OverrideJwtSettings(JWT_CLAIMS_USER=True)
+    def test_no_query(self):
+        with self.assertNumQueries(0):
+            user = get_user_by_token(self.token)
+
+            self.assertIsInstance(user, ClaimsUser)
+            self.assertEqual(user.pk, self.user.pk)
+            self.assertEqual(user.get_username(), self.user.get_username())
+            self.assertTrue(user.is_authenticated)
+            self.assertFalse(user.is_staff)
+
+        self.assertEqual(user, self.user)
+        self.assertEqual(self.user, user)
+
+    @OverrideJwtSettings(JWT_CLAIMS_USER=True)
+    def test_load_missing_attribute(self):
+        user = get_user_by_token(self.token)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(user.date_joined, self.user.date_joined)
+            self.assertEqual(user.last_login, self.user.last_login)
+
+    @OverrideJwtSettings(JWT_CLAIMS_USER=True)
+    def test_has_perm(self):
+        user = get_user_by_token(self.token)
+
+        self.assertTrue(user.has_perm("tests.run_tests"))
+        self.assertFalse(user.has_perms(["tests.run_tests", "tests.other"]))
+
+    @OverrideJwtSettings(JWT_CLAIMS_USER=True)
+    def test_superuser_has_perm(self):
+        self.user.is_superuser = True
+        self.user.save()
+        user = get_user_by_token(utils.jwt_encode(utils.jwt_payload(self.user)))
+
+        with self.assertNumQueries(0):
+            self.assertTrue(user.has_perm("tests.other"))
+
+    @OverrideJwtSettings(JWT_CLAIMS_USER=True)
+    def test_deleted_user(self):
+        user = get_user_by_token(self.token)
+        self.user.delete()
+
+        with self.assertRaises(exceptions.JSONWebTokenError):
+            user.date_joined
+
+    @OverrideJwtSettings(JWT_CLAIMS_USER=True)
+    def test_token_without_claims(self):
+        token = utils.jwt_encode(object_types.TokenPayloadType(**{self.user.USERNAME_FIELD: self.user.get_username()}))
+        user = get_user_by_token(token)
+
+        self.assertNotIsInstance(user, ClaimsUser)
+        self.assertEqual(user, self.user)
+
+
+class ClaimsUserTestsAsync(AsyncTestCase):
+    @OverrideJwtSettings(JWT_CLAIMS_USER=True)
+    def setUp(self):
+        reload(object_types)
+        self.addCleanup(reload, object_types)
+        super().setUp()
+
+    @OverrideJwtSettings(JWT_CLAIMS_USER=True)
+    async def test_aload(self):
+        user = await get_user_by_token_async(self.token)
+
+        self.assertIsInstance(user, ClaimsUser)
+        self.assertEqual(await user.aload(), self.user)
@@ -0,0 +1,194 @@
+import json
+import os
+import tempfile
+from unittest import mock
+
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+import jwt
+from jwt.algorithms import RSAAlgorithm
+
+from strawberry_django_jwt2 import exceptions, utils
+from strawberry_django_jwt2.codec import JSONWebKeySet, get_token_codec
+from strawberry_django_jwt2.settings import jwt_settings
+from tests.decorators import OverrideJwtSettings
+from tests.testcases import TestCase
+
+
+class TokenCodecTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.private_key = rsa.generate_private_key(
+            public_exponent=65537,
+            key_size=2048,
+            backend=default_backend(),
+        )
+        self.private_pem = self.private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ).decode()
+        self.public_pem = (
+            self.private_key.public_key()
+            .public_bytes(
+                serialization.Encoding.PEM,
+                serialization.PublicFormat.SubjectPublicKeyInfo,
+            )
+            .decode()
+        )
+
+    def test_cached(self):
+        self.assertIs(get_token_codec(), get_token_codec())
+
+    def test_prepare_pem_keys(self):
+        with OverrideJwtSettings(
+            JWT_PUBLIC_KEY=self.public_pem,
+            JWT_PRIVATE_KEY=self.private_pem,
+            JWT_ALGORITHM="RS256",
+        ):
+            codec = get_token_codec()
+            token = utils.jwt_encode(self.payload)
+            decoded = utils.jwt_decode(token)
+
+        self.assertIsInstance(codec.signing_key, rsa.RSAPrivateKey)
+        self.assertIsInstance(codec.verifying_key, rsa.RSAPublicKey)
+        self.assertEqual(self.payload, decoded)
+
+    def test_reload_settings(self):
+        codec = get_token_codec()
+
+        with OverrideJwtSettings(JWT_LEEWAY=10):
+            self.assertIsNot(get_token_codec(), codec)
+            self.assertEqual(get_token_codec().leeway, 10)
+
+    @OverrideJwtSettings(JWT_ALGORITHM="unknown")
+    def test_unknown_algorithm(self):
+        codec = get_token_codec()
+
+        self.assertEqual(codec.signing_key, jwt_settings.JWT_SECRET_KEY)
+
+
+class KeyRingTests(TestCase):
+    @OverrideJwtSettings(JWT_KEY_ID="current")
+    def test_stamp_kid(self):
+        token = utils.jwt_encode(self.payload)
+
+        self.assertEqual(jwt.get_unverified_header(token)["kid"], "current")
+        self.assertEqual(utils.jwt_decode(token), self.payload)
+
+    def test_rotation(self):
+        with OverrideJwtSettings(JWT_KEY_ID="old", JWT_SECRET_KEY="old-secret"):
+            token = utils.jwt_encode(self.payload)
+
+        with OverrideJwtSettings(
+            JWT_KEY_ID="new",
+            JWT_SECRET_KEY="new-secret",
+            JWT_KEY_RING={"old": "old-secret"},
+        ):
+            self.assertEqual(utils.jwt_decode(token), self.payload)
+
+    @OverrideJwtSettings(JWT_KEY_RING={"other": "other-secret"})
+    def test_token_without_kid(self):
+        self.assertEqual(utils.jwt_decode(self.token), self.payload)
+
+    def test_unknown_kid(self):
+        with OverrideJwtSettings(JWT_KEY_ID="unknown"):
+            token = utils.jwt_encode(self.payload)
+
+        with OverrideJwtSettings(JWT_KEY_RING={"other": "other-secret"}), self.assertRaises(exceptions.JSONWebTokenError):
+            utils.get_payload(token)
+
+
+class JSONWebKeySetTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.private_key = rsa.generate_private_key(
+            public_exponent=65537,
+            key_size=2048,
+            backend=default_backend(),
+        )
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = os.path.join(tmp_dir.name, "jwks.json")
+        self.write_jwks("service", self.private_key)
+
+    def write_jwks(self, kid, private_key):
+        jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+        jwk.update(kid=kid, alg="RS256", use="sig")
+
+        with open(self.path, "w", encoding="utf8") as jwks:
+            json.dump({"keys": [jwk]}, jwks)
+
+    def encode(self, kid, private_key):
+        return jwt.encode(self.payload.__dict__, private_key, "RS256", headers={"kid": kid})
+
+    def test_decode(self):
+        token = self.encode("service", self.private_key)
+
+        with OverrideJwtSettings(JWT_JWKS_FILE=self.path):
+            self.assertEqual(utils.jwt_decode(token), self.payload)
+            # Tokens signed by this service keep using the local key
+            self.assertEqual(utils.jwt_decode(self.token), self.payload)
+
+    def test_unknown_kid(self):
+        token = self.encode("other", self.private_key)
+
+        with OverrideJwtSettings(JWT_JWKS_FILE=self.path), self.assertRaises(exceptions.JSONWebTokenError):
+            utils.get_payload(token)
+
+    def test_load_once(self):
+        key_set = JSONWebKeySet(self.path, "RS256", 60)
+
+        with mock.patch.object(key_set, "load", wraps=key_set.load) as load_mock:
+            key_set.get("service")
+            key_set.get("service")
+
+        load_mock.assert_called_once()
+
+    def test_reload_on_change(self):
+        key_set = JSONWebKeySet(self.path, "RS256", 0)
+        self.assertIsNotNone(key_set.get("service"))
+
+        self.write_jwks("rotated", self.private_key)
+        os.utime(self.path, ns=(0, 0))
+
+        self.assertIsNone(key_set.get("service"))
+        self.assertIsNotNone(key_set.get("rotated"))
+
+    def test_missing_file(self):
+        os.remove(self.path)
+        token = self.encode("service", self.private_key)
+
+        with OverrideJwtSettings(JWT_JWKS_FILE=self.path), self.assertRaises(exceptions.JSONWebTokenError):
+            utils.get_payload(token)
+
+    def test_invalid_document_keeps_keys(self):
+        key_set = JSONWebKeySet(self.path, "RS256", 0)
+        self.assertIsNotNone(key_set.get("service"))
+
+        with open(self.path, "w", encoding="utf8") as jwks:
+            jwks.write("{")
+        os.utime(self.path, ns=(0, 0))
+
+        self.assertIsNotNone(key_set.get("service"))
+
+    def test_skip_invalid_key(self):
+        jwk = json.loads(RSAAlgorithm.to_jwk(self.private_key.public_key()))
+        jwk.update(kid="service", alg="RS256", use="sig")
+
+        with open(self.path, "w", encoding="utf8") as jwks:
+            json.dump({"keys": [dict(jwk, kid="hmac", alg="HS256"), jwk]}, jwks)
+
+        key_set = JSONWebKeySet(self.path, "RS256", 0)
+        self.assertIsNone(key_set.get("hmac"))
+        self.assertIsNotNone(key_set.get("service"))
+
+    def test_skip_none_algorithm(self):
+        with open(self.path, "w", encoding="utf8") as jwks:
+            json.dump({"keys": [{"kid": "service", "kty": "oct", "alg": "none"}]}, jwks)
+
+        token = self.encode("service", self.private_key)
+
+        with OverrideJwtSettings(JWT_JWKS_FILE=self.path), self.assertRaises(exceptions.JSONWebTokenError):
+            utils.get_payload(token)
@@ -1,9 +1,18 @@
+from importlib import reload
+import inspect
+from types import SimpleNamespace
+from unittest import mock
+
 import django
+from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser, Permission
+from django.contrib.contenttypes.models import ContentType
 
-from strawberry_django_jwt2 import decorators, exceptions
+from strawberry_django_jwt2 import decorators, exceptions, object_types, utils
+from strawberry_django_jwt2.shortcuts import get_user_by_token, get_user_by_token_async
 from tests.decorators import OverrideJwtSettings
-from tests.testcases import TestCase
+from tests.models import MyTestModel
+from tests.testcases import AsyncTestCase, TestCase
 
 
 class UserPassesTests(TestCase):
@@ -98,6 +107,100 @@ class PermissionRequiredTests(TestCase):
         with self.assertRaises(exceptions.PermissionDenied):
             func(None, info=self.info(self.user))
 
+    def test_permission_cached_per_request(self):
+        info = self.info(self.user)
+        funcs = [decorators.permission_required(perm)(lambda src, info: None) for perm in ("auth.add_user", ["auth.add_user"])]
+
+        with mock.patch.object(type(self.user), "has_perms", return_value=True) as has_perms_mock:
+            for func in funcs * 2:
+                func(None, info=info)
+
+            func(None, info=self.info(self.user))
+
+        self.assertEqual(has_perms_mock.call_count, 2)
+        has_perms_mock.assert_called_with(("auth.add_user",))
+
+
+class EmbeddedPermissionsTests(TestCase):
+    @OverrideJwtSettings(JWT_EMBED_PERMISSIONS=True)
+    def setUp(self):
+        reload(object_types)
+        self.addCleanup(reload, object_types)
+        super().setUp()
+
+    @OverrideJwtSettings(JWT_EMBED_PERMISSIONS=True)
+    def test_payload_perms(self):
+        self.assertEqual(self.payload.perms, ["tests.run_tests"])
+
+        self.user.is_superuser = True
+        self.assertEqual(utils.jwt_payload(self.user).perms, ["*"])
+
+    @OverrideJwtSettings(JWT_EMBED_PERMISSIONS=True)
+    def test_permission_required(self):
+        user = get_user_by_token(self.token)
+        func = decorators.permission_required("tests.run_tests")(lambda src, info: None)
+        denied = decorators.permission_required(["tests.run_tests", "auth.add_user"])(lambda src, info: None)
+
+        with self.assertNumQueries(0):
+            self.assertIsNone(func(None, info=self.info(user)))
+
+            with self.assertRaises(exceptions.PermissionDenied):
+                denied(None, info=self.info(user))
+
+    @OverrideJwtSettings(JWT_EMBED_PERMISSIONS=True, JWT_CLAIMS_USER=True)
+    def test_claims_user(self):
+        reload(object_types)
+        user = get_user_by_token(utils.jwt_encode(utils.jwt_payload(self.user)))
+
+        with self.assertNumQueries(0):
+            self.assertTrue(user.has_perm("tests.run_tests"))
+            self.assertFalse(user.has_perms(["tests.run_tests", "auth.add_user"]))
+
+    @OverrideJwtSettings(JWT_EMBED_PERMISSIONS=True)
+    def test_token_without_perms(self):
+        payload = utils.jwt_payload(self.user)
+        payload.perms = None
+        user = get_user_by_token(utils.jwt_encode(payload))
+
+        self.assertIsNone(getattr(user, "token_perms", None))
+        self.assertTrue(user.has_perm("tests.run_tests"))
+
+
+class EmbeddedPermissionsTestsAsync(AsyncTestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(reload, object_types)
+        self.user.user_permissions.add(
+            Permission.objects.create(
+                codename="run_tests",
+                name="Can run tests",
+                content_type=ContentType.objects.get_for_model(MyTestModel),
+            ),
+        )
+
+    @OverrideJwtSettings(JWT_EMBED_PERMISSIONS=True)
+    async def test_create_user_token_async(self):
+        reload(object_types)
+        token = await utils.create_user_token(self.user)
+
+        self.assertEqual(token.payload.perms, ["tests.run_tests"])
+        self.assertEqual(await get_user_by_token_async(token.token), self.user)
+
+    @OverrideJwtSettings(JWT_EMBED_PERMISSIONS=True)
+    async def test_create_user_tokens_async(self):
+        reload(object_types)
+        other_user = await get_user_model().objects.acreate(username="other")
+        tokens = await utils.create_user_tokens([self.user, other_user])
+
+        self.assertEqual([token.payload.perms for token in tokens], [["tests.run_tests"], []])
+
+    @OverrideJwtSettings(JWT_EMBED_PERMISSIONS=True)
+    async def test_on_token_auth_resolve_async(self):
+        reload(object_types)
+        result = await decorators.on_token_auth_resolve_async((self.info(self.user), self.user, SimpleNamespace()))
+
+        self.assertEqual(result.payload.perms, ["tests.run_tests"])
+
 
 class CSRFRotationTests(TestCase):
     @OverrideJwtSettings(JWT_CSRF_ROTATION=True)
@@ -122,3 +225,14 @@ class HelperDecoratorTests(TestCase):
 
         # self is preserved, 1 is disposed as the "None" root object, args are [2, {**kwargs}]
         self.assertDictEqual(result, {"self": self, "args": 2, "kwargs": 0})
+
+    def test_dispose_extra_kwargs_signature_once(self):
+        def accept_fn(cls, x=None):
+            return x
+
+        with mock.patch("strawberry_django_jwt2.decorators.inspect.signature", wraps=inspect.signature) as signature_mock:
+            wrapped = decorators.dispose_extra_kwargs(accept_fn)
+            results = [wrapped(None, x=5, y=6) for _ in range(2)]
+
+        self.assertEqual(results, [5, 5])
+        signature_mock.assert_called_once()
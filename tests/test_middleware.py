@@ -1,15 +1,21 @@
 from unittest import mock
 
 from asgiref.sync import sync_to_async
+from django.contrib.auth import user_login_failed
 from django.contrib.auth.models import AnonymousUser
+from graphql.pyutils import Path
+import strawberry
 
 from strawberry_django_jwt2.exceptions import JSONWebTokenError
 from strawberry_django_jwt2.middleware import (
     AsyncJSONWebTokenMiddleware,
     JSONWebTokenMiddleware,
     allow_any,
+    get_allow_any_table,
+    get_skip_table,
 )
 from strawberry_django_jwt2.settings import jwt_settings
+from tests.context_managers import catch_signal
 from tests.decorators import OverrideJwtSettings
 from tests.testcases import AsyncTestCase, TestCase
 
@@ -178,6 +184,119 @@ class AuthenticateByArgumentTests(TestCase):
         self.assertFalse(hasattr(info_mock.context, "user"))
 
 
+class AuthenticatePerOperationTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.middleware = JSONWebTokenMiddleware
+
+    def info(self, user=None, **headers):
+        info_mock = super().info(user, **headers)
+        info_mock.path = Path(None, "test", "Query")
+        return info_mock
+
+    @OverrideJwtSettings(JWT_AUTHENTICATE_PER_OPERATION=True, JWT_ALLOW_ANY_HANDLER=lambda *args: False)
+    def test_authenticate_once(self):
+        headers = {
+            jwt_settings.JWT_AUTH_HEADER_NAME: f"{jwt_settings.JWT_AUTH_HEADER_PREFIX} {self.token}",
+        }
+
+        next_mock = mock.Mock()
+        info_mock = self.info(AnonymousUser(), **headers)
+        nested_info_mock = self.info(**headers)
+        nested_info_mock.context = info_mock.context
+        nested_info_mock.path = Path(info_mock.path, 0, "Query")
+
+        middleware = self.middleware(execution_context=info_mock.context)
+
+        with mock.patch("strawberry_django_jwt2.middleware.authenticate", return_value=self.user) as authenticate_mock:
+            next(middleware.on_execute())
+            middleware.resolve(next_mock, None, info_mock)
+            middleware.resolve(next_mock, None, nested_info_mock)
+
+        authenticate_mock.assert_called_once_with(request=info_mock.context)
+        self.assertEqual(next_mock.call_count, 2)
+        self.assertEqual(info_mock.context.user, self.user)
+
+    @OverrideJwtSettings(JWT_AUTHENTICATE_PER_OPERATION=True, JWT_ALLOW_ANY_HANDLER=lambda *args: False)
+    def test_invalid_token(self):
+        headers = {
+            jwt_settings.JWT_AUTH_HEADER_NAME: f"{jwt_settings.JWT_AUTH_HEADER_PREFIX} invalid",
+        }
+
+        next_mock = mock.Mock()
+        info_mock = self.info(AnonymousUser(), **headers)
+
+        middleware = self.middleware(execution_context=info_mock.context)
+        next(middleware.on_execute())
+
+        with self.assertRaises(JSONWebTokenError):
+            middleware.resolve(next_mock, None, info_mock)
+
+        next_mock.assert_not_called()
+
+    @OverrideJwtSettings(JWT_AUTHENTICATE_PER_OPERATION=True, JWT_ALLOW_ANY_HANDLER=lambda *args: True)
+    def test_invalid_token_allow_any(self):
+        headers = {
+            jwt_settings.JWT_AUTH_HEADER_NAME: f"{jwt_settings.JWT_AUTH_HEADER_PREFIX} invalid",
+        }
+
+        next_mock = mock.Mock()
+        info_mock = self.info(AnonymousUser(), **headers)
+
+        middleware = self.middleware(execution_context=info_mock.context)
+        next(middleware.on_execute())
+        middleware.resolve(next_mock, None, info_mock)
+
+        next_mock.assert_called_once_with(None, info_mock)
+        self.assertIsInstance(info_mock.context.user, AnonymousUser)
+
+    @OverrideJwtSettings(JWT_AUTHENTICATE_PER_OPERATION=True, JWT_ALLOW_ARGUMENT=True)
+    def test_argument_falls_back_to_field(self):
+        info_mock = self.info(AnonymousUser())
+
+        middleware = self.middleware(execution_context=info_mock.context)
+        next(middleware.on_execute())
+
+        self.assertFalse(middleware.operation_authenticated)
+
+
+class DirectAuthenticationTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.middleware = JSONWebTokenMiddleware
+        self.headers = {
+            jwt_settings.JWT_AUTH_HEADER_NAME: f"{jwt_settings.JWT_AUTH_HEADER_PREFIX} {self.token}",
+        }
+
+    @OverrideJwtSettings(JWT_MIDDLEWARE_DIRECT_AUTH=True, JWT_ALLOW_ANY_HANDLER=lambda *args: False)
+    def test_authenticate(self):
+        next_mock = mock.Mock()
+        info_mock = self.info(AnonymousUser(), **self.headers)
+
+        middleware = self.middleware(execution_context=info_mock.context)
+        with mock.patch("strawberry_django_jwt2.middleware.authenticate") as authenticate_mock:
+            middleware.resolve(next_mock, None, info_mock)
+
+        authenticate_mock.assert_not_called()
+        next_mock.assert_called_once_with(None, info_mock)
+        self.assertEqual(info_mock.context.user, self.user)
+        self.assertEqual(info_mock.context.user.backend, "strawberry_django_jwt2.backends.JSONWebTokenBackend")
+
+    @OverrideJwtSettings(JWT_MIDDLEWARE_DIRECT_AUTH=True, JWT_ALLOW_ANY_HANDLER=lambda *args: False)
+    def test_user_login_failed(self):
+        next_mock = mock.Mock()
+        info_mock = self.info(AnonymousUser(), **self.headers)
+        self.user.delete()
+
+        middleware = self.middleware(execution_context=info_mock.context)
+        with catch_signal(user_login_failed) as user_login_failed_handler:
+            middleware.resolve(next_mock, None, info_mock)
+
+        user_login_failed_handler.assert_called_once()
+        next_mock.assert_called_once_with(None, info_mock)
+        self.assertIsInstance(info_mock.context.user, AnonymousUser)
+
+
 class AllowAnyTests(TestCase):
     def info(self, user, **headers):
         info_mock = super().info(user, **headers)
@@ -225,6 +344,88 @@ class AllowAnyTests(TestCase):
         self.assertFalse(allowed)
 
 
+class AllowAnyTableTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        @strawberry.type
+        class Viewer:
+            name: str
+
+        @strawberry.type
+        class Query:
+            test: str
+            viewer: Viewer
+
+        self.schema = strawberry.Schema(query=Query)._schema
+
+    def info(self, user, field_name="viewer", **headers):
+        info_mock = super().info(user, **headers)
+        info_mock.schema = self.schema
+        info_mock.parent_type = self.schema.query_type
+        info_mock.field_name = field_name
+        return info_mock
+
+    @OverrideJwtSettings(JWT_ALLOW_ANY_CLASSES=["graphql.GraphQLObjectType"])
+    def test_allow_any(self):
+        table = get_allow_any_table(self.schema)
+
+        self.assertIs(get_allow_any_table(self.schema), table)
+        self.assertTrue(table["Query", "viewer"])
+        self.assertFalse(table["Query", "test"])
+        self.assertFalse(table["Viewer", "name"])
+
+        with mock.patch("strawberry_django_jwt2.middleware.field_allows_any") as field_allows_any_mock:
+            self.assertTrue(allow_any(self.info(self.user)))
+            self.assertFalse(allow_any(self.info(self.user, "test")))
+
+        field_allows_any_mock.assert_not_called()
+
+    def test_settings_change(self):
+        self.assertFalse(allow_any(self.info(self.user)))
+
+        with OverrideJwtSettings(JWT_ALLOW_ANY_CLASSES=["graphql.GraphQLObjectType"]):
+            self.assertTrue(allow_any(self.info(self.user)))
+
+
+class SkipTableTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        @strawberry.type
+        class Viewer:
+            name: str
+
+            @strawberry.field
+            def secret(self) -> str:
+                return "secret"
+
+            @strawberry.field
+            def other(self, token: str) -> str:
+                return token
+
+        @strawberry.type
+        class Query:
+            viewer: Viewer
+
+        self.schema = strawberry.Schema(query=Query)._schema
+
+    def test_skip_nested_fields(self):
+        table = get_skip_table(self.schema)
+
+        self.assertTrue(table["Viewer", "name"])
+        self.assertFalse(table["Viewer", "secret"])
+        self.assertFalse(table["Viewer", "other"])
+
+    @OverrideJwtSettings(JWT_ALLOW_ARGUMENT=True)
+    def test_allow_argument(self):
+        table = get_skip_table(self.schema)
+
+        self.assertTrue(table["Viewer", "name"])
+        self.assertFalse(table["Viewer", "secret"])
+        self.assertFalse(table["Viewer", "other"])
+
+
 class AuthenticateByHeaderTestsAsync(AsyncTestCase):
     def setUp(self):
         super().setUp()
@@ -311,6 +512,52 @@ class AuthenticateByHeaderTestsAsync(AsyncTestCase):
         self.assertIsInstance(info_mock.context.user, AnonymousUser)
 
 
+class AuthenticatePerOperationTestsAsync(AsyncTestCase):
+    def setUp(self):
+        super().setUp()
+        self.middleware = AsyncJSONWebTokenMiddleware
+
+    @OverrideJwtSettings(JWT_AUTHENTICATE_PER_OPERATION=True, JWT_ALLOW_ANY_HANDLER=lambda *args: False)
+    async def test_authenticate_once_async(self):
+        headers = {
+            jwt_settings.JWT_AUTH_HEADER_NAME.replace("HTTP_", ""): f"{jwt_settings.JWT_AUTH_HEADER_PREFIX} {self.token}",
+        }
+
+        next_mock = mock.Mock()
+        info_mock = self.info(AnonymousUser(), **headers)
+        info_mock.path = Path(None, "test", "Query")
+
+        middleware = self.middleware(execution_context=info_mock.context)
+        await middleware.on_execute().__anext__()
+
+        with mock.patch("strawberry_django_jwt2.middleware.authenticate_async") as authenticate_mock:
+            await middleware.resolve(next_mock, None, info_mock)
+            await middleware.resolve(next_mock, None, info_mock)
+
+        authenticate_mock.assert_not_called()
+        self.assertEqual(next_mock.call_count, 2)
+        self.assertEqual(info_mock.context.user, self.user)
+
+
+class DirectAuthenticationTestsAsync(AsyncTestCase):
+    @OverrideJwtSettings(JWT_MIDDLEWARE_DIRECT_AUTH=True, JWT_ALLOW_ANY_HANDLER=lambda *args: False)
+    async def test_authenticate_async(self):
+        headers = {
+            jwt_settings.JWT_AUTH_HEADER_NAME.replace("HTTP_", ""): f"{jwt_settings.JWT_AUTH_HEADER_PREFIX} {self.token}",
+        }
+
+        next_mock = mock.Mock()
+        info_mock = self.info(AnonymousUser(), **headers)
+
+        middleware = AsyncJSONWebTokenMiddleware(execution_context=info_mock.context)
+        with mock.patch("strawberry_django_jwt2.middleware.authenticate_async") as authenticate_mock:
+            await middleware.resolve(next_mock, None, info_mock)
+
+        authenticate_mock.assert_not_called()
+        next_mock.assert_called_once_with(None, info_mock)
+        self.assertEqual(info_mock.context.user, self.user)
+
+
 class AuthenticateByArgumentTestsAsync(AsyncTestCase):
     @OverrideJwtSettings(JWT_ALLOW_ARGUMENT=True)
     def setUp(self):
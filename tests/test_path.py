@@ -1,4 +1,5 @@
 from django.test import TestCase
+from graphql.pyutils import Path
 
 from strawberry_django_jwt2.path import PathDict, filter_strings
 
@@ -34,3 +35,31 @@ class PathDictTests(TestCase):
 
         self.assertTrue(value)
         self.assertTrue(self.path_dict[("0", "1", "2")])
+
+
+class PathNodeTests(TestCase):
+    def setUp(self):
+        self.path_dict = PathDict()
+        self.root = Path(None, "0", "Query")
+        self.item = self.root.add_key(0).add_key("1", "Type")
+
+    def test_insert(self):
+        self.path_dict.insert(self.root, True)
+
+        self.assertEqual(self.path_dict.nodes[id(self.root)], (self.root, True))
+        self.assertEqual(dict(self.path_dict), {})
+
+    def test_parent(self):
+        self.assertIsNone(self.path_dict.parent(self.root))
+
+        self.path_dict.insert(self.root, True)
+        current_path = self.item.add_key("2", "Type")
+
+        self.assertTrue(self.path_dict.parent(current_path))
+        self.assertEqual(self.path_dict.nodes[id(self.item)], (self.item, True))
+
+    def test_parent_by_identity(self):
+        self.path_dict.insert(Path(None, "0", "Query"), True)
+
+        self.assertIsNone(self.path_dict.parent(self.item))
+        self.assertIsNone(self.path_dict.parent(self.item.add_key("2", "Type")))
@@ -1,4 +1,5 @@
 from typing import List
+from unittest import mock
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
@@ -13,6 +14,7 @@ from strawberry_django_jwt2.decorators import (
     login_required,
     permission_required,
 )
+from strawberry_django_jwt2.middleware import JSONWebTokenMiddleware
 from strawberry_django_jwt2.mixins import JSONWebTokenMixin
 from strawberry_django_jwt2.model_object_types import UserType
 from strawberry_django_jwt2.settings import jwt_settings
@@ -68,6 +70,72 @@ class QueriesTests(SchemaTestCase):
         self.assertEqual(data["test"], "TEST")
         self.assertIsNone(response.errors)
 
+    @OverrideJwtSettings(JWT_MIDDLEWARE_SKIP_LEAF_FIELDS=True)
+    def test_nested_fields_skip_middleware(self):
+        query = """
+        query Test {
+            test {
+                username
+                isAuthenticated
+            }
+        }
+        """
+
+        headers = {
+            jwt_settings.JWT_AUTH_HEADER_NAME: f"{jwt_settings.JWT_AUTH_HEADER_PREFIX} {self.token}",
+        }
+
+        with mock.patch.object(JSONWebTokenMiddleware, "resolve_base", autospec=True, side_effect=JSONWebTokenMiddleware.resolve_base) as resolve_base:
+            response = self.client.execute(query, **headers)
+
+        self.assertIsNone(response.errors)
+        self.assertEqual(response.data["test"]["username"], self.user.username)
+        self.assertEqual(resolve_base.call_count, 1)
+
+    @OverrideJwtSettings(JWT_MIDDLEWARE_SKIP_LEAF_FIELDS=True, JWT_ALLOW_ANY_CLASSES=["graphql.GraphQLObjectType"])
+    def test_nested_fields_allow_any_root(self):
+        @strawberry.type
+        class Viewer:
+            name: str
+
+            @strawberry.field
+            def me(self, info: Info) -> str:
+                return str(info.context.user)
+
+        @strawberry.type
+        class Query(JSONWebTokenMixin):
+            @strawberry.field
+            def viewer(self) -> Viewer:
+                return Viewer(name="viewer")
+
+        self.client.schema(query=Query, mutation=self.Mutation)
+
+        query = """
+        query Test {
+            viewer {
+                name
+                me
+            }
+        }
+        """
+
+        headers = {
+            jwt_settings.JWT_AUTH_HEADER_NAME: f"{jwt_settings.JWT_AUTH_HEADER_PREFIX} {self.token}",
+        }
+
+        response = self.client.execute(query, **headers)
+
+        self.assertIsNone(response.errors)
+        self.assertEqual(response.data["viewer"], {"name": "viewer", "me": self.user.get_username()})
+
+        headers = {
+            jwt_settings.JWT_AUTH_HEADER_NAME: f"{jwt_settings.JWT_AUTH_HEADER_PREFIX} invalid",
+        }
+
+        response = self.client.execute(query, **headers)
+
+        self.assertIsNotNone(response.errors)
+
     @OverrideJwtSettings(JWT_ALLOW_ARGUMENT=True)
     def test_multiple_credentials(self):
         query = """
@@ -250,6 +318,40 @@ class QueriesTests(SchemaTestCase):
         self.assertEqual(data["test"], "TEST")
         self.assertIsNone(response.errors)
 
+    @OverrideJwtSettings(JWT_AUTHENTICATE_PER_OPERATION=True)
+    def test_login_required_per_operation(self):
+        @strawberry.type
+        class Query(JSONWebTokenMixin):
+            @strawberry.field
+            @login_required
+            def test(self) -> str:
+                return "TEST"
+
+            @strawberry.field
+            @login_required
+            def test_info(self, info: Info) -> str:
+                return "TEST-INFO"
+
+        self.client.schema(query=Query, mutation=self.Mutation)
+
+        query = """
+        query Test {
+            test
+            testInfo
+        }
+        """
+
+        headers = {
+            jwt_settings.JWT_AUTH_HEADER_NAME: f"{jwt_settings.JWT_AUTH_HEADER_PREFIX} {self.token}",
+        }
+
+        response = self.client.execute(query, **headers)
+        data = response.data
+
+        self.assertEqual(data["test"], "TEST")
+        self.assertEqual(data["testInfo"], "TEST-INFO")
+        self.assertIsNone(response.errors)
+
     def test_introspection(self):
         headers = {
             jwt_settings.JWT_AUTH_HEADER_NAME: f"{jwt_settings.JWT_AUTH_HEADER_PREFIX} {self.token}",
@@ -325,6 +427,31 @@ class AsyncQueriesTests(AsyncSchemaTestCase):
         self.assertEqual(data["test"], "TEST")
         self.assertIsNone(response.errors)
 
+    @OverrideJwtSettings(JWT_AUTHENTICATE_PER_OPERATION=True)
+    async def test_login_required_per_operation(self):
+        @strawberry.type
+        class Query(JSONWebTokenMixin):
+            @strawberry.field
+            @login_required
+            async def test(self) -> str:
+                return "TEST"
+
+        self.client.schema(query=Query, mutation=self.Mutation)
+
+        query = """
+        query Test {
+            test
+        }
+        """
+
+        self.client.authenticate(self.token)
+
+        response = await self.client.execute(query)
+        data = response.data
+
+        self.assertEqual(data["test"], "TEST")
+        self.assertIsNone(response.errors)
+
     @OverrideJwtSettings(JWT_ALLOW_ARGUMENT=True)
     async def test_multiple_credentials(self):
         query = """
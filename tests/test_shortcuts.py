@@ -1,3 +1,5 @@
+from django.contrib.auth import get_user_model
+
 from strawberry_django_jwt2 import shortcuts
 from tests.testcases import UserTestCase
 
@@ -8,3 +10,9 @@ class ShortcutsTests(UserTestCase):
         user = shortcuts.get_user_by_token(token)
 
         self.assertEqual(user, self.user)
+
+    def test_get_tokens(self):
+        other_user = get_user_model().objects.create_user("other")
+        tokens = shortcuts.get_tokens([self.user, other_user])
+
+        self.assertEqual([shortcuts.get_user_by_token(token) for token in tokens], [self.user, other_user])
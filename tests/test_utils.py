@@ -7,6 +7,7 @@ from unittest import mock
 
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.asymmetric import rsa
+from django.contrib.auth import get_user_model
 
 from strawberry_django_jwt2 import exceptions, utils
 import strawberry_django_jwt2.object_types
@@ -189,6 +190,22 @@ class GetUserByNaturalKeyTestsAsync(AsyncTestCase):
         user = await utils.get_user_by_natural_key_async(0)
         self.assertIsNone(user)
 
+    async def test_user_by_natural_key_async(self):
+        with mock.patch.object(utils, "sync_to_async") as sync_to_async_mock:
+            user = await utils.get_user_by_natural_key_async(self.user.username)
+
+        self.assertEqual(user, self.user)
+        sync_to_async_mock.assert_not_called()
+
+    async def test_custom_manager_async(self):
+        get_by_natural_key = mock.Mock(return_value=self.user)
+
+        with mock.patch.object(type(get_user_model().objects), "get_by_natural_key", get_by_natural_key):
+            user = await utils.get_user_by_natural_key_async(self.user.username)
+
+        self.assertEqual(user, self.user)
+        get_by_natural_key.assert_called_once_with(self.user.username)
+
 
 class GetUserByPayloadTestsAsync(AsyncTestCase):
     async def test_user_by_invalid_payload_async(self):
@@ -223,3 +240,22 @@ class CreateUserTokenTestsAsync(AsyncTestCase):
         assert user == self.user
         assert token.refresh_token is not None
         assert token.refresh_expires_in - jwt_settings.JWT_REFRESH_EXPIRATION_DELTA.total_seconds() < 5
+
+
+class CreateUserTokensTestsAsync(AsyncTestCase):
+    @OverrideJwtSettings(JWT_LONG_RUNNING_REFRESH_TOKEN=False)
+    async def test_create_user_tokens_async(self):
+        other_user = await get_user_model().objects.acreate(username="other")
+        tokens = await utils.create_user_tokens([self.user, other_user])
+
+        self.assertEqual([await get_user_by_token_async(token.token) for token in tokens], [self.user, other_user])
+        self.assertIsNone(tokens[0].refresh_token)
+
+    @OverrideJwtSettings(JWT_LONG_RUNNING_REFRESH_TOKEN=True)
+    async def test_create_user_tokens_with_refresh_async(self):
+        other_user = await get_user_model().objects.acreate(username="other")
+        tokens = await utils.create_user_tokens([self.user, other_user])
+
+        self.assertIsNotNone(tokens[0].refresh_token)
+        self.assertNotEqual(tokens[0].refresh_token, tokens[1].refresh_token)
+        self.assertTrue(tokens[1].refresh_expires_in - jwt_settings.JWT_REFRESH_EXPIRATION_DELTA.total_seconds() < 5)